@@ -3,6 +3,8 @@ import os
 from pathlib import Path
 from collections import Counter
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Dict, List, Optional
 
 
@@ -18,7 +20,7 @@ def analyze_single_file(file_path: str, column_name: str = 'InstrumentType') ->
         Series with value counts or empty Series if error
     """
     try:
-        df = pd.read_excel(file_path)
+        df = pd.read_excel(file_path, engine='calamine', usecols=lambda col: col == column_name)
         if column_name in df.columns:
             return df[column_name].value_counts()
         else:
@@ -29,6 +31,38 @@ def analyze_single_file(file_path: str, column_name: str = 'InstrumentType') ->
         return pd.Series()
 
 
+def extract_file_document_types(file_path: Path) -> Counter:
+    """
+    Count document types (part before ' -') in one file's InstrumentType column.
+    
+    Args:
+        file_path: Path to the Excel file
+        
+    Returns:
+        Counter of document types (empty if error)
+    """
+    try:
+        df = pd.read_excel(
+            file_path,
+            engine='calamine',
+            usecols=lambda col: col == 'InstrumentType',
+            dtype=str
+        )
+        if 'InstrumentType' in df.columns:
+            # Split on the first ' -' for the whole column at once
+            values = df['InstrumentType'].dropna().str.strip()
+            doc_types = values.str.split(' -', n=1).str[0].str.strip()
+            return Counter(doc_types[doc_types != ''].value_counts().to_dict())
+    except Exception as e:
+        print(f"  Error processing {os.path.basename(file_path)}: {e}")
+    return Counter()
+
+
+def _worker_count() -> int:
+    """Worker processes for parsing files, leaving one core free."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
 def analyze_all_indexes(
     directory: str = 'madison_docs/DuProcess Indexes',
     column_name: str = 'InstrumentType',
@@ -65,16 +99,22 @@ def analyze_all_indexes(
     files_processed = 0
     files_with_column = 0
     
-    for i, file_path in enumerate(excel_files, 1):
-        if show_progress and i % 50 == 0:
-            print(f"Processing file {i}/{len(excel_files)}...")
-        
-        value_counts = analyze_single_file(str(file_path), column_name)
-        if not value_counts.empty:
-            files_with_column += 1
-            for value, count in value_counts.items():
-                all_counts[value] += count
-        files_processed += 1
+    # Excel parsing is CPU-bound, so spread files across worker processes
+    with ProcessPoolExecutor(max_workers=_worker_count()) as executor:
+        results = executor.map(
+            partial(analyze_single_file, column_name=column_name),
+            map(str, excel_files),
+            chunksize=1
+        )
+        for i, value_counts in enumerate(results, 1):
+            if show_progress and i % 50 == 0:
+                print(f"Processing file {i}/{len(excel_files)}...")
+            
+            if not value_counts.empty:
+                files_with_column += 1
+                for value, count in value_counts.items():
+                    all_counts[value] += count
+            files_processed += 1
     
     print(f"\nProcessed {files_processed} files")
     print(f"Files with column '{column_name}': {files_with_column}")
@@ -109,23 +149,12 @@ def extract_document_types(directory: str = 'madison_docs/DuProcess Indexes') ->
     
     doc_type_counts = Counter()
     
-    for i, file_path in enumerate(excel_files, 1):
-        if i % 50 == 0:
-            print(f"Processing file {i}/{len(excel_files)}...")
-        
-        try:
-            df = pd.read_excel(file_path)
-            if 'InstrumentType' in df.columns:
-                for val in df['InstrumentType'].dropna():
-                    val_str = str(val).strip()
-                    if ' -' in val_str:
-                        doc_type = val_str.split(' -')[0].strip()
-                    else:
-                        doc_type = val_str
-                    if doc_type:
-                        doc_type_counts[doc_type] += 1
-        except Exception as e:
-            print(f"  Error processing {os.path.basename(file_path)}: {e}")
+    with ProcessPoolExecutor(max_workers=_worker_count()) as executor:
+        results = executor.map(extract_file_document_types, excel_files, chunksize=1)
+        for i, file_counts in enumerate(results, 1):
+            if i % 50 == 0:
+                print(f"Processing file {i}/{len(excel_files)}...")
+            doc_type_counts.update(file_counts)
     
     # Convert to DataFrame
     if doc_type_counts:
@@ -1,8 +1,6 @@
 import os
 import argparse
 from pathlib import Path
-import tkinter as tk
-from tkinter import filedialog
 from typing import Optional, List, Dict, Any, Union
 import datetime
 import uuid
@@ -501,6 +499,10 @@ def correct_ocr_with_ai(text: str) -> str:
 # --- File Selection ---
 def select_file() -> Optional[str]:
     """Open a file dialog to select a PDF document."""
+    # Imported here so --file runs (and headless machines) never load Tk
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()  # Hide the main window
     
@@ -511,6 +513,7 @@ def select_file() -> Optional[str]:
             ("All files", "*.*")
         ]
     )
+    root.destroy()
     
     if not file_path:
         print("No file selected.")
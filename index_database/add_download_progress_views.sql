@@ -0,0 +1,57 @@
+-- Add the materialized view read by the download progress report and health
+-- monitor (madison_county_doc_puller/download_validator.py)
+-- Run this as postgres user:
+-- psql -h 127.0.0.1 -p 5432 -U postgres -d madison_county_index -f add_download_progress_views.sql
+--
+-- The reports refresh the view themselves once it is more than a minute old,
+-- which needs the report user to own it. Otherwise refresh it from cron as the
+-- owner:
+-- * * * * * cd /path/to/repo && python3 madison_county_doc_puller/download_validator.py --refresh-views
+
+BEGIN;
+
+-- Superseded by the priority column of index_documents_counters
+-- (add_stats_rollup.sql)
+DROP MATERIALIZED VIEW IF EXISTS mv_download_progress;
+
+-- When each progress view was last refreshed (shown in the reports). A view
+-- with no row here is refreshed by the next report.
+CREATE TABLE IF NOT EXISTS progress_view_refreshes (
+    view_name TEXT PRIMARY KEY,
+    refreshed_at TIMESTAMP NOT NULL
+);
+
+-- Completions (by downloaded_at) and failures (by updated_at) per minute over
+-- the last 8 days. Minute buckets keep the 1-hour and 24-hour windows exact
+-- to the minute; hourly figures are summed from them.
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_download_throughput AS
+SELECT
+    bucket,
+    SUM(completed)::bigint AS completed,
+    SUM(failed)::bigint AS failed
+FROM (
+    SELECT date_trunc('minute', downloaded_at) AS bucket, COUNT(*) AS completed, 0 AS failed
+    FROM index_documents
+    WHERE download_status = 'completed'
+      AND downloaded_at > CURRENT_TIMESTAMP - INTERVAL '8 days'
+    GROUP BY 1
+    UNION ALL
+    SELECT date_trunc('minute', updated_at), 0, COUNT(*)
+    FROM index_documents
+    WHERE download_status = 'failed'
+      AND updated_at > CURRENT_TIMESTAMP - INTERVAL '8 days'
+    GROUP BY 1
+) b
+GROUP BY bucket;
+
+-- REFRESH ... CONCURRENTLY needs a unique index
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_download_throughput
+    ON mv_download_throughput(bucket);
+
+COMMIT;
+
+-- Verify
+SELECT
+    (SELECT SUM(completed) FROM mv_download_throughput) AS completed_last_8_days,
+    (SELECT refreshed_at FROM progress_view_refreshes
+     WHERE view_name = 'mv_download_throughput') AS refreshed_at;
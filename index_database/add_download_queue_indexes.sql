@@ -0,0 +1,71 @@
+-- Add partial indexes matching the download queue and monitoring queries in
+-- madison_county_doc_puller (download_queue_manager.py, download_validator.py)
+-- Run this as postgres user:
+-- psql -h 127.0.0.1 -p 5432 -U postgres -d madison_county_index -f add_download_queue_indexes.sql
+
+-- identify_gaps: loose index scan over distinct completed books
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_completed_book
+    ON index_documents(book)
+    WHERE download_status = 'completed';
+
+-- fetch_next_batch: the keyset claim walks pending rows in queue order.
+-- The expressions must match QUEUE_KEY_SQL exactly for the planner to use it.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pending_queue
+    ON index_documents(
+        COALESCE(download_priority, 2147483647),
+        COALESCE(book, 2147483647),
+        COALESCE(page, 2147483647),
+        id
+    )
+    WHERE download_status = 'pending';
+
+-- reset_in_progress_records: stale claims older than 30 minutes
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_in_progress_updated_at
+    ON index_documents(updated_at)
+    WHERE download_status = 'in_progress';
+
+-- calculate_throughput, estimate_completion, hourly activity: recent completions
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_completed_downloaded_at
+    ON index_documents(downloaded_at)
+    WHERE download_status = 'completed';
+
+-- Stage progress count: documents completed or claimed in the last 7 days.
+-- Partial, so pending/failed/skipped row versions never get an entry. The
+-- queue statistics last_hour spans every status and is left unindexed: it
+-- runs at most once per STATS_TTL next to a full scan of the stage's rows,
+-- and a plain updated_at index would take a new entry on every UPDATE since
+-- the updated_at trigger changes it each time.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_processed_updated_at
+    ON index_documents(updated_at)
+    WHERE download_status IN ('completed', 'in_progress');
+
+-- Superseded by the partial indexes above and below. idx_docs_recent_completion
+-- served a success-rate query the health monitor no longer runs (it now reads
+-- mv_download_throughput).
+DROP INDEX CONCURRENTLY IF EXISTS idx_updated_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_docs_recent_completion;
+
+-- Health monitor recent errors (last hour of failures, grouped by message id
+-- without visiting the table) and the failure buckets of mv_download_throughput
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_docs_failed_recent
+    ON index_documents(updated_at DESC, download_error_id)
+    WHERE download_status = 'failed';
+
+-- Error summaries: failed rows grouped by interned message
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_failed_error
+    ON index_documents(download_error_id)
+    WHERE download_status = 'failed' AND download_error_id IS NOT NULL;
+
+-- Verify
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'index_documents'
+  AND indexname IN (
+      'idx_completed_book',
+      'idx_pending_queue',
+      'idx_in_progress_updated_at',
+      'idx_completed_downloaded_at',
+      'idx_processed_updated_at',
+      'idx_docs_failed_recent',
+      'idx_failed_error'
+  );
@@ -0,0 +1,37 @@
+-- Add error_messages, the lookup table that download failures reference by id
+-- so error summaries group on an integer instead of the message text
+-- Run this as postgres user:
+-- psql -h 127.0.0.1 -p 5432 -U postgres -d madison_county_index -f add_error_messages.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS error_messages (
+    id SERIAL PRIMARY KEY,
+    message TEXT NOT NULL UNIQUE
+);
+
+ALTER TABLE index_documents
+    ADD COLUMN IF NOT EXISTS download_error_id INTEGER REFERENCES error_messages(id);
+
+-- Backfill from the messages already stored on failed and retrying rows
+INSERT INTO error_messages (message)
+SELECT DISTINCT download_error
+FROM index_documents
+WHERE download_status IN ('failed', 'pending')
+  AND download_error IS NOT NULL
+ON CONFLICT (message) DO NOTHING;
+
+UPDATE index_documents d
+SET download_error_id = e.id
+FROM error_messages e
+WHERE e.message = d.download_error
+  AND d.download_status IN ('failed', 'pending')
+  AND d.download_error_id IS NULL;
+
+COMMIT;
+
+-- Verify
+SELECT
+    (SELECT COUNT(*) FROM error_messages) AS distinct_messages,
+    COUNT(*) FILTER (WHERE download_error_id IS NOT NULL) AS rows_with_error_id
+FROM index_documents;
@@ -0,0 +1,114 @@
+-- Add index_documents_counters, the trigger-maintained row counts read by
+-- update_index_data.py statistics and the download_validator.py reports
+-- Run this as postgres user:
+-- psql -h 127.0.0.1 -p 5432 -U postgres -d madison_county_index -f add_stats_rollup.sql
+
+BEGIN;
+
+-- Block writers while the counters are seeded so no delta is missed
+LOCK TABLE index_documents IN SHARE ROW EXCLUSIVE MODE;
+
+-- Superseded by index_documents_counters
+DROP MATERIALIZED VIEW IF EXISTS index_documents_stats;
+
+-- Recreated: the slot and priority columns change the primary key. The rows
+-- are reseeded below.
+DROP TABLE IF EXISTS index_documents_counters;
+
+-- Row counts per (source, download_status, download_priority), split over
+-- slots: each backend adds into slot pg_backend_pid() % 32, so concurrent
+-- download workers rarely wait on the same counter row. Readers SUM(n) over
+-- the slots. NULL status is stored as 'unknown', NULL priority as 0.
+CREATE TABLE index_documents_counters (
+    source VARCHAR(50) NOT NULL,
+    download_status VARCHAR(50) NOT NULL,
+    download_priority INTEGER NOT NULL DEFAULT 0,
+    slot SMALLINT NOT NULL DEFAULT 0,
+    n BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, download_status, download_priority, slot)
+);
+
+-- Inserts and deletes are counted per statement from the transition table,
+-- so a bulk load touches each counter row once. Updates are counted per row
+-- and the trigger only fires when source, status or priority actually changes,
+-- so the updates that touch none of them skip it and no transition tables are
+-- built.
+CREATE OR REPLACE FUNCTION index_documents_counters_apply()
+RETURNS TRIGGER AS $$
+DECLARE
+    s SMALLINT := pg_backend_pid() % 32;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM index_documents_counters;
+    ELSIF TG_OP = 'INSERT' THEN
+        INSERT INTO index_documents_counters AS c (source, download_status, download_priority, slot, n)
+        SELECT source, COALESCE(download_status, 'unknown'), COALESCE(download_priority, 0), s, COUNT(*)
+        FROM new_rows
+        GROUP BY 1, 2, 3
+        ON CONFLICT (source, download_status, download_priority, slot) DO UPDATE SET n = c.n + EXCLUDED.n;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO index_documents_counters AS c (source, download_status, download_priority, slot, n)
+        SELECT source, COALESCE(download_status, 'unknown'), COALESCE(download_priority, 0), s, -COUNT(*)
+        FROM old_rows
+        GROUP BY 1, 2, 3
+        ON CONFLICT (source, download_status, download_priority, slot) DO UPDATE SET n = c.n + EXCLUDED.n;
+    ELSE
+        INSERT INTO index_documents_counters AS c (source, download_status, download_priority, slot, n)
+        VALUES
+            (OLD.source, COALESCE(OLD.download_status, 'unknown'), COALESCE(OLD.download_priority, 0), s, -1),
+            (NEW.source, COALESCE(NEW.download_status, 'unknown'), COALESCE(NEW.download_priority, 0), s, 1)
+        ON CONFLICT (source, download_status, download_priority, slot) DO UPDATE SET n = c.n + EXCLUDED.n;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS index_documents_counters_insert ON index_documents;
+CREATE TRIGGER index_documents_counters_insert
+    AFTER INSERT ON index_documents
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION index_documents_counters_apply();
+
+DROP TRIGGER IF EXISTS index_documents_counters_update ON index_documents;
+CREATE TRIGGER index_documents_counters_update
+    AFTER UPDATE OF download_status, source, download_priority ON index_documents
+    FOR EACH ROW
+    WHEN (OLD.download_status IS DISTINCT FROM NEW.download_status
+          OR OLD.source IS DISTINCT FROM NEW.source
+          OR OLD.download_priority IS DISTINCT FROM NEW.download_priority)
+    EXECUTE FUNCTION index_documents_counters_apply();
+
+DROP TRIGGER IF EXISTS index_documents_counters_delete ON index_documents;
+CREATE TRIGGER index_documents_counters_delete
+    AFTER DELETE ON index_documents
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION index_documents_counters_apply();
+
+DROP TRIGGER IF EXISTS index_documents_counters_truncate ON index_documents;
+CREATE TRIGGER index_documents_counters_truncate
+    AFTER TRUNCATE ON index_documents
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION index_documents_counters_apply();
+
+-- Seed from the current table contents
+DELETE FROM index_documents_counters;
+INSERT INTO index_documents_counters (source, download_status, download_priority, n)
+SELECT source, COALESCE(download_status, 'unknown'), COALESCE(download_priority, 0), COUNT(*)
+FROM index_documents
+GROUP BY 1, 2, 3;
+
+COMMIT;
+
+-- Lets the imported_today filter (import_date > NOW() - INTERVAL '24 hours')
+-- run as an index-only range scan instead of a full table scan
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_import_date ON index_documents(import_date);
+
+-- Verify
+SELECT
+    'Counters installed' as status,
+    SUM(n) as total_records,
+    COUNT(*) as counter_rows
+FROM index_documents_counters;
@@ -14,6 +14,11 @@ This data is used for:
 import os
 import sys
 import re
+import csv
+import io
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple, Set
 from datetime import datetime
@@ -22,7 +27,7 @@ import logging
 
 import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_batch
+from psycopg2.extras import execute_values
 from tqdm import tqdm
 
 
@@ -44,6 +49,12 @@ BASE_DIR = Path(__file__).parent.parent
 DUPROCESS_DIR = BASE_DIR / 'madison_docs' / 'DuProcess Indexes'
 HISTORIC_DEEDS_FILE = BASE_DIR / 'madison_docs' / 'Deeds - Historic - Typewritten Only.xlsx'
 
+# CREATE INDEX statements for indexes dropped by _drop_secondary_indexes,
+# written before the drop and removed once they are rebuilt. If a load is
+# interrupted before the rebuild finishes, restore them with:
+#   psql -d madison_county_index -f index_database/.dropped_indexes.sql
+DROPPED_INDEXES_FILE = Path(__file__).parent / '.dropped_indexes.sql'
+
 # Logging configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -388,6 +399,67 @@ def safe_timestamp(value: Any) -> Optional[datetime]:
 # Database Operations
 # ============================================================================
 
+# Column order for INSERT
+INSERT_COLUMNS = [
+    'source', 'source_file', 'gin', 'instrument_number', 'book_volume',
+    'book', 'page', 'instrument_type_raw', 'instrument_type_parsed',
+    'document_type', 'file_date', 'num_pages', 'party_type', 'party_seq',
+    'searched_name', 'cross_party_name', 'grantor_party', 'grantee_party',
+    'description', 'location', 'direction', 'legals', 'sub_div', 'block',
+    'lot', 'sec', 'town', 'rng', 'square', 'remarks',
+    'ne_of_ne', 'nw_of_ne', 'sw_of_ne', 'se_of_ne',
+    'ne_of_nw', 'nw_of_nw', 'sw_of_nw', 'se_of_nw',
+    'ne_of_sw', 'nw_of_sw', 'sw_of_sw', 'se_of_sw',
+    'ne_of_se', 'nw_of_se', 'sw_of_se', 'se_of_se',
+    'address', 'street_name', 'city', 'zip', 'parcel_num',
+    'parcel_id', 'ppin', 'patent_num',
+    'workflow_status', 'verified_status', 'doc_status', 'related_items_raw'
+]
+INSERT_COLUMNS_SQL = ', '.join(INSERT_COLUMNS)
+SOURCE_FILE_INDEX = INSERT_COLUMNS.index('source_file')
+
+UPSERT_SQL = """
+    ON CONFLICT (book, page, source) DO UPDATE SET
+        updated_at = CURRENT_TIMESTAMP,
+        source_file = EXCLUDED.source_file
+"""
+
+# xmax = 0 only on freshly inserted rows, so callers can tell inserts from updates
+RETURNING_SQL = "RETURNING source, (xmax = 0)"
+
+INSERT_SQL = f"INSERT INTO index_documents ({INSERT_COLUMNS_SQL}) VALUES %s {UPSERT_SQL}"
+
+# Batches above this size go through COPY instead of multi-row INSERT
+COPY_THRESHOLD = 5000
+
+
+def collapse_duplicate_rows(records: List[Dict[str, Any]]) -> List[List[Any]]:
+    """
+    Turn records into INSERT_COLUMNS rows, one per (book, page, source).
+
+    Rows keep the order in which each key first appears, with that first
+    record's fields. A later duplicate only replaces source_file, so the last
+    file wins exactly as it would with one ON CONFLICT upsert per file.
+
+    Args:
+        records: Record dictionaries to insert
+
+    Returns:
+        Value lists in INSERT_COLUMNS order
+    """
+    values = []
+    positions = {}
+    for record in records:
+        key = (record.get('book'), record.get('page'), record.get('source'))
+        pos = positions.get(key)
+        if pos is None:
+            positions[key] = len(values)
+            values.append([record.get(col) for col in INSERT_COLUMNS])
+        else:
+            values[pos][SOURCE_FILE_INDEX] = record.get('source_file')
+    return values
+
+
 class IndexDatabase:
     """Database connection and operations manager"""
 
@@ -421,55 +493,184 @@ class IndexDatabase:
         count = self.cursor.fetchone()[0]
         return count
 
-    def insert_batch(self, records: List[Dict[str, Any]], batch_size: int = 1000):
-        """Insert records in batches"""
-        if not records:
-            return
-
-        # Define column order for INSERT
-        columns = [
-            'source', 'source_file', 'gin', 'instrument_number', 'book_volume',
-            'book', 'page', 'instrument_type_raw', 'instrument_type_parsed',
-            'document_type', 'file_date', 'num_pages', 'party_type', 'party_seq',
-            'searched_name', 'cross_party_name', 'grantor_party', 'grantee_party',
-            'description', 'location', 'direction', 'legals', 'sub_div', 'block',
-            'lot', 'sec', 'town', 'rng', 'square', 'remarks',
-            'ne_of_ne', 'nw_of_ne', 'sw_of_ne', 'se_of_ne',
-            'ne_of_nw', 'nw_of_nw', 'sw_of_nw', 'se_of_nw',
-            'ne_of_sw', 'nw_of_sw', 'sw_of_sw', 'se_of_sw',
-            'ne_of_se', 'nw_of_se', 'sw_of_se', 'se_of_se',
-            'address', 'street_name', 'city', 'zip', 'parcel_num',
-            'parcel_id', 'ppin', 'patent_num',
-            'workflow_status', 'verified_status', 'doc_status', 'related_items_raw'
-        ]
-
-        # Build INSERT statement with ON CONFLICT handling
-        placeholders = ', '.join(['%s'] * len(columns))
-        columns_str = ', '.join(columns)
-
-        insert_query = f"""
-            INSERT INTO index_documents ({columns_str})
-            VALUES ({placeholders})
-            ON CONFLICT (book, page, source) DO UPDATE SET
-                updated_at = CURRENT_TIMESTAMP,
-                source_file = EXCLUDED.source_file
+    def insert_batch(self, records: List[Dict[str, Any]], batch_size: int = 1000,
+                     commit: bool = True) -> Counter:
         """
+        Insert records as multi-row INSERT statements.
+
+        DuProcess files repeat a document once per party, so rows are first
+        collapsed to one per (book, page, source) by collapse_duplicate_rows;
+        batches may span several files. Batches larger than COPY_THRESHOLD
+        are streamed through COPY into a staging table.
+
+        Args:
+            records: Record dictionaries to insert
+            batch_size: Rows per multi-row INSERT statement
+            commit: Commit after the batch. Pass False to keep several batches
+                in one transaction; the caller then commits (a failure still
+                rolls back everything since the last commit).
+
+        Returns:
+            Counter of newly inserted rows per source (updates are not counted)
+        """
+        if not records:
+            return Counter()
 
-        # Convert records to tuples
-        values = [
-            tuple(record.get(col) for col in columns)
-            for record in records
-        ]
+        values = collapse_duplicate_rows(records)
 
-        # Execute batch insert
         try:
-            execute_batch(self.cursor, insert_query, values, page_size=batch_size)
-            self.conn.commit()
+            if len(values) > COPY_THRESHOLD:
+                returned = self._copy_batch(values)
+            else:
+                returned = execute_values(
+                    self.cursor, f"{INSERT_SQL} {RETURNING_SQL}", values,
+                    page_size=batch_size, fetch=True
+                )
+            if commit:
+                self.conn.commit()
         except psycopg2.Error as e:
             self.conn.rollback()
             logger.error(f"Batch insert failed: {e}")
             raise
 
+        return Counter(source for source, inserted in returned if inserted)
+
+    def _copy_batch(self, values: List[List[Any]]) -> List[Tuple[str, bool]]:
+        """COPY rows into a temp staging table, then upsert them in one statement."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(values)
+        buffer.seek(0)
+
+        self.cursor.execute(f"""
+            CREATE TEMP TABLE IF NOT EXISTS index_documents_stage
+            ON COMMIT DELETE ROWS
+            AS SELECT {INSERT_COLUMNS_SQL} FROM index_documents WITH NO DATA
+        """)
+        # ON COMMIT only clears it between transactions, not between batches
+        self.cursor.execute("TRUNCATE index_documents_stage")
+        self.cursor.copy_expert(
+            f"COPY index_documents_stage ({INSERT_COLUMNS_SQL}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+        self.cursor.execute(f"""
+            INSERT INTO index_documents ({INSERT_COLUMNS_SQL})
+            SELECT {INSERT_COLUMNS_SQL} FROM index_documents_stage
+            {UPSERT_SQL}
+            {RETURNING_SQL}
+        """)
+        return self.cursor.fetchall()
+
+
+def _tune_for_bulk(conn):
+    """
+    Tune the session and table for a bulk load.
+
+    Uses session-level SET rather than SET LOCAL because insert_batch commits
+    after every file, which would discard transaction-scoped settings.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("SET synchronous_commit = OFF")
+        cursor.execute("SET work_mem = '256MB'")
+        cursor.execute("SET maintenance_work_mem = '1GB'")
+    conn.commit()
+
+    # Table-level changes need ownership; the app user may not have it
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("ALTER TABLE index_documents SET (autovacuum_enabled = false)")
+        conn.commit()
+        logger.info("Session tuned for bulk load (autovacuum paused on index_documents)")
+    except psycopg2.Error as e:
+        conn.rollback()
+        logger.warning(f"Could not pause autovacuum on index_documents: {e}")
+
+
+def _restore_after_bulk(conn, rows_added: bool, reindex: bool = True):
+    """Undo _tune_for_bulk and refresh table statistics/indexes after the load."""
+    conn.rollback()
+    conn.autocommit = True  # VACUUM cannot run inside a transaction block
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("RESET synchronous_commit")
+            try:
+                cursor.execute("ALTER TABLE index_documents RESET (autovacuum_enabled)")
+            except psycopg2.Error as e:
+                logger.warning(f"Could not re-enable autovacuum on index_documents: {e}")
+            if rows_added:
+                logger.info("Running VACUUM ANALYZE and REINDEX on index_documents...")
+                cursor.execute("VACUUM ANALYZE index_documents")
+                if reindex:
+                    cursor.execute("REINDEX INDEX idx_book_page")
+    finally:
+        conn.autocommit = False
+
+
+def _drop_secondary_indexes(conn) -> List[Tuple[str, str]]:
+    """
+    Drop every index on index_documents except the primary key and unique
+    constraints (ON CONFLICT needs unique_book_page_source).
+
+    The CREATE INDEX statements are written to DROPPED_INDEXES_FILE before
+    anything is dropped, so the indexes can be restored by hand if the
+    rebuild never runs.
+
+    Returns:
+        List of (index_name, CREATE INDEX statement) for _recreate_indexes
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT c.relname, pg_get_indexdef(ix.indexrelid)
+            FROM pg_index ix
+            JOIN pg_class c ON c.oid = ix.indexrelid
+            WHERE ix.indrelid = 'index_documents'::regclass
+              AND NOT ix.indisprimary
+              AND NOT ix.indisunique
+        """)
+        indexes = cursor.fetchall()
+        if not indexes:
+            return []
+
+        # Append, so a second drop before an earlier rebuild keeps both sets
+        with open(DROPPED_INDEXES_FILE, 'a', encoding='utf-8') as f:
+            for _, ddl in indexes:
+                f.write(ddl.replace('CREATE INDEX', 'CREATE INDEX IF NOT EXISTS', 1) + ';\n')
+        logger.info(f"Saved index definitions to {DROPPED_INDEXES_FILE}")
+
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+    conn.commit()
+
+    logger.info(f"Dropped {len(indexes)} secondary indexes")
+    return indexes
+
+
+def _recreate_indexes(conn, indexes: List[Tuple[str, str]]) -> bool:
+    """
+    Recreate indexes dropped by _drop_secondary_indexes.
+
+    Meant to be called from a finally block, so errors are logged rather than
+    raised and never mask the exception that ended the load.
+
+    Returns:
+        True if every index was rebuilt (DROPPED_INDEXES_FILE is then removed)
+    """
+    try:
+        conn.rollback()
+        conn.autocommit = True  # CREATE INDEX CONCURRENTLY cannot run in a transaction
+        try:
+            with conn.cursor() as cursor:
+                for name, ddl in tqdm(indexes, desc="Recreating indexes"):
+                    cursor.execute(ddl.replace('CREATE INDEX', 'CREATE INDEX CONCURRENTLY IF NOT EXISTS', 1))
+        finally:
+            conn.autocommit = False
+    except psycopg2.Error as e:
+        logger.error(f"Failed to recreate indexes: {e}. "
+                     f"Restore them with: psql -f {DROPPED_INDEXES_FILE}")
+        return False
+
+    DROPPED_INDEXES_FILE.unlink(missing_ok=True)
+    return True
+
 
 # ============================================================================
 # Data Loading Functions
@@ -485,24 +686,39 @@ def load_duprocess_file(file_path: Path) -> List[Dict[str, Any]]:
     Returns:
         List of record dictionaries ready for database insertion
     """
+    # calamine (Rust) parses the sheet in a single pass; much faster than openpyxl
     try:
-        df = pd.read_excel(file_path)
+        df = pd.read_excel(file_path, engine='calamine')
         logger.info(f"Loaded {len(df)} rows from {file_path.name}")
     except Exception as e:
         logger.error(f"Failed to load {file_path.name}: {e}")
         return []
 
+    columns = {name: idx for idx, name in enumerate(df.columns)}
+    rows = df.itertuples(index=False, name=None)
+    return _duprocess_rows_to_records(rows, columns, file_path.name)
+
+
+def _duprocess_rows_to_records(rows, columns: Dict[str, int], source_file: str) -> List[Dict[str, Any]]:
+    """Convert positional DuProcess row tuples into record dictionaries."""
     records = []
+    # Each file has only a few hundred distinct instrument types
+    instrument_types: Dict[Optional[str], Tuple[Optional[str], Optional[str]]] = {}
+
+    for values in rows:
+        width = len(values)
+        row = {name: values[idx] for name, idx in columns.items() if idx < width}
 
-    for _, row in df.iterrows():
         # Parse instrument type
         raw_instrument_type = safe_str(row.get('InstrumentType'))
-        parsed_type, doc_type = parse_instrument_type(raw_instrument_type)
+        if raw_instrument_type not in instrument_types:
+            instrument_types[raw_instrument_type] = parse_instrument_type(raw_instrument_type)
+        parsed_type, doc_type = instrument_types[raw_instrument_type]
 
         # Build record
         record = {
             'source': 'DuProcess',
-            'source_file': file_path.name,
+            'source_file': source_file,
             'gin': safe_int(row.get('Gin')),
             'instrument_number': safe_int(row.get('Instrument #')),
             'book_volume': safe_str(row.get('Book/Volume')),
@@ -582,7 +798,14 @@ def load_historic_deeds(file_path: Path) -> List[Dict[str, Any]]:
         List of record dictionaries (minimal fields)
     """
     try:
-        df = pd.read_excel(file_path)
+        # Only book/page are used; read them as text so lettered books and
+        # blank cells don't leave pandas guessing a mixed/float dtype
+        df = pd.read_excel(
+            file_path,
+            engine='calamine',
+            usecols=lambda col: col in ('book', 'page'),
+            dtype=str
+        )
         logger.info(f"Loaded {len(df)} rows from {file_path.name}")
     except Exception as e:
         logger.error(f"Failed to load {file_path.name}: {e}")
@@ -590,93 +813,80 @@ def load_historic_deeds(file_path: Path) -> List[Dict[str, Any]]:
 
     records = []
 
-    for _, row in df.iterrows():
-        # Parse book and page
-        book_str = safe_str(row.get('book'))
-        page_str = safe_str(row.get('page'))
+    # Validate book/page for the whole sheet at once. Book letters (like
+    # "YYY") are special designations and are skipped for now, as are
+    # missing, zero and non-integer values.
+    missing = pd.Series(index=df.index, dtype='float64')
+    books = pd.to_numeric(df['book'] if 'book' in df.columns else missing, errors='coerce')
+    pages = pd.to_numeric(df['page'] if 'page' in df.columns else missing, errors='coerce')
+    valid = (books % 1 == 0) & (pages % 1 == 0) & (books != 0) & (pages != 0)
 
-        # Try to convert to integers
-        book = None
-        page = None
+    book_values = books[valid].astype('int64').tolist()
+    page_values = pages[valid].astype('int64').tolist()
 
-        if book_str:
-            # Handle book letters (like "YYY") - these might be special designations
-            # For now, skip non-numeric books or map them
-            try:
-                book = int(book_str)
-            except ValueError:
-                # Could log or handle special book designations here
-                continue
-
-        if page_str:
-            try:
-                page = int(page_str)
-            except ValueError:
-                continue
-
-        if book and page:
-            record = {
-                'source': 'Historical',
-                'source_file': file_path.name,
-                'book': book,
-                'page': page,
-                # All other fields will be NULL
-                'gin': None,
-                'instrument_number': None,
-                'book_volume': None,
-                'instrument_type_raw': None,
-                'instrument_type_parsed': None,
-                'document_type': None,
-                'file_date': None,
-                'num_pages': None,
-                'party_type': None,
-                'party_seq': None,
-                'searched_name': None,
-                'cross_party_name': None,
-                'grantor_party': None,
-                'grantee_party': None,
-                'description': None,
-                'location': None,
-                'direction': None,
-                'legals': None,
-                'sub_div': None,
-                'block': None,
-                'lot': None,
-                'sec': None,
-                'town': None,
-                'rng': None,
-                'square': None,
-                'remarks': None,
-                'ne_of_ne': None,
-                'nw_of_ne': None,
-                'sw_of_ne': None,
-                'se_of_ne': None,
-                'ne_of_nw': None,
-                'nw_of_nw': None,
-                'sw_of_nw': None,
-                'se_of_nw': None,
-                'ne_of_sw': None,
-                'nw_of_sw': None,
-                'sw_of_sw': None,
-                'se_of_sw': None,
-                'ne_of_se': None,
-                'nw_of_se': None,
-                'sw_of_se': None,
-                'se_of_se': None,
-                'address': None,
-                'street_name': None,
-                'city': None,
-                'zip': None,
-                'parcel_num': None,
-                'parcel_id': None,
-                'ppin': None,
-                'patent_num': None,
-                'workflow_status': None,
-                'verified_status': None,
-                'doc_status': None,
-                'related_items_raw': None,
-            }
-            records.append(record)
+    for book, page in zip(book_values, page_values):
+        record = {
+            'source': 'Historical',
+            'source_file': file_path.name,
+            'book': book,
+            'page': page,
+            # All other fields will be NULL
+            'gin': None,
+            'instrument_number': None,
+            'book_volume': None,
+            'instrument_type_raw': None,
+            'instrument_type_parsed': None,
+            'document_type': None,
+            'file_date': None,
+            'num_pages': None,
+            'party_type': None,
+            'party_seq': None,
+            'searched_name': None,
+            'cross_party_name': None,
+            'grantor_party': None,
+            'grantee_party': None,
+            'description': None,
+            'location': None,
+            'direction': None,
+            'legals': None,
+            'sub_div': None,
+            'block': None,
+            'lot': None,
+            'sec': None,
+            'town': None,
+            'rng': None,
+            'square': None,
+            'remarks': None,
+            'ne_of_ne': None,
+            'nw_of_ne': None,
+            'sw_of_ne': None,
+            'se_of_ne': None,
+            'ne_of_nw': None,
+            'nw_of_nw': None,
+            'sw_of_nw': None,
+            'se_of_nw': None,
+            'ne_of_sw': None,
+            'nw_of_sw': None,
+            'sw_of_sw': None,
+            'se_of_sw': None,
+            'ne_of_se': None,
+            'nw_of_se': None,
+            'sw_of_se': None,
+            'se_of_se': None,
+            'address': None,
+            'street_name': None,
+            'city': None,
+            'zip': None,
+            'parcel_num': None,
+            'parcel_id': None,
+            'ppin': None,
+            'patent_num': None,
+            'workflow_status': None,
+            'verified_status': None,
+            'doc_status': None,
+            'related_items_raw': None,
+        }
+        records.append(record)
 
     return records
 
@@ -685,8 +895,14 @@ def load_historic_deeds(file_path: Path) -> List[Dict[str, Any]]:
 # Main Import Logic
 # ============================================================================
 
-def import_all_data():
-    """Main import function"""
+def import_all_data(first_import: bool = False):
+    """
+    Main import function
+
+    Args:
+        first_import: Drop secondary indexes before loading and rebuild them
+            afterwards. Only worthwhile when loading into an empty table.
+    """
     logger.info("=" * 80)
     logger.info("Madison County Title Plant - Index Data Import")
     logger.info("=" * 80)
@@ -699,7 +915,15 @@ def import_all_data():
         logger.error(f"Cannot proceed without database connection: {e}")
         return
 
+    rows_added = False
+    dropped_indexes = []
+
     try:
+        _tune_for_bulk(db.conn)
+
+        if first_import:
+            dropped_indexes = _drop_secondary_indexes(db.conn)
+
         # ====================================================================
         # 1. Import DuProcess Indexes
         # ====================================================================
@@ -718,13 +942,17 @@ def import_all_data():
             excel_files = sorted(DUPROCESS_DIR.glob("*.xlsx"))
             logger.info(f"Found {len(excel_files)} Excel files in {DUPROCESS_DIR}")
 
-            # Process each file with progress bar
+            # Parse files in worker processes; inserts stay on the main
+            # process connection and overlap with parsing of later files
             total_records = 0
-            for file_path in tqdm(excel_files, desc="Processing DuProcess files"):
-                records = load_duprocess_file(file_path)
-                if records:
-                    db.insert_batch(records)
-                    total_records += len(records)
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for records in tqdm(executor.map(load_duprocess_file, excel_files, chunksize=1),
+                                    total=len(excel_files), desc="Processing DuProcess files"):
+                    if records:
+                        db.insert_batch(records)
+                        total_records += len(records)
+                        rows_added = True
 
             logger.info(f"Imported {total_records:,} DuProcess records")
 
@@ -746,6 +974,7 @@ def import_all_data():
             if records:
                 logger.info(f"Inserting {len(records):,} Historic Deeds records...")
                 db.insert_batch(records)
+                rows_added = True
                 logger.info(f"Imported {len(records):,} Historic Deeds records")
 
         # ====================================================================
@@ -762,12 +991,12 @@ def import_all_data():
             GROUP BY source
             ORDER BY source
         """)
+        total = 0
         for source, count in db.cursor.fetchall():
             logger.info(f"  {source}: {count:,} records")
+            total += count
 
-        # Total records
-        db.cursor.execute("SELECT COUNT(*) FROM index_documents")
-        total = db.cursor.fetchone()[0]
+        # Total records (source is NOT NULL, so the per-source counts cover every row)
         logger.info(f"\nTotal records in database: {total:,}")
 
         # Download queue status
@@ -796,7 +1025,17 @@ def import_all_data():
         logger.error(f"Import failed: {e}", exc_info=True)
         raise
     finally:
-        db.close()
+        # Each step runs even if an earlier one fails
+        if dropped_indexes:
+            _recreate_indexes(db.conn, dropped_indexes)
+        try:
+            _restore_after_bulk(db.conn, rows_added, reindex=not dropped_indexes)
+        except psycopg2.Error as e:
+            logger.error(f"Failed to restore table settings after bulk load: {e}")
+        try:
+            db.close()
+        except psycopg2.Error as e:
+            logger.error(f"Failed to close database connection: {e}")
 
 
 # ============================================================================
@@ -805,6 +1044,12 @@ def import_all_data():
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description='Import index data into the Madison County index database')
+    parser.add_argument('--first-import', action='store_true',
+                        help='Drop secondary indexes during the load and rebuild them afterwards '
+                             '(initial load into an empty table only)')
+    args = parser.parse_args()
+
     print("\nMadison County Title Plant - Index Data Import\n")
 
     # Check for required environment variables
@@ -822,6 +1067,8 @@ def main():
     print(f"  DuProcess Indexes: {DUPROCESS_DIR}")
     print(f"  Historic Deeds: {HISTORIC_DEEDS_FILE}")
     print(f"  Database: {DB_CONFIG['database']} @ {DB_CONFIG['host']}:{DB_CONFIG['port']}")
+    if args.first_import:
+        print("  Mode: first import (secondary indexes dropped and rebuilt)")
     print()
 
     response = input("Continue? (yes/no): ").strip().lower()
@@ -830,7 +1077,7 @@ def main():
         sys.exit(0)
 
     # Run import
-    import_all_data()
+    import_all_data(first_import=args.first_import)
 
 
 if __name__ == '__main__':
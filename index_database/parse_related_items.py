@@ -14,7 +14,7 @@ Format: "INSTRUMENT_NUMBER bk:BOOK/PAGE"
 Multiple references separated by newlines.
 
 Usage:
-    python3 parse_related_items.py [--dry-run] [--batch-size 1000]
+    python3 parse_related_items.py [--dry-run] [--batch-size 1000] [--commit-size 50000]
 """
 
 import sys
@@ -148,7 +148,7 @@ def add_columns_if_needed(conn, dry_run: bool = False):
 # Parsing Functions
 # ============================================================================
 
-def parse_related_item(raw_text: str) -> List[Dict]:
+def parse_related_item(raw_text: str) -> List[Tuple[int, int, int]]:
     """
     Parse related_items text into structured format.
 
@@ -159,7 +159,7 @@ def parse_related_item(raw_text: str) -> List[Dict]:
         raw_text: Raw related_items text
 
     Returns:
-        List of parsed references
+        List of unique (instrument_number, book, page) tuples
     """
     if not raw_text or not raw_text.strip():
         return []
@@ -183,13 +183,7 @@ def parse_related_item(raw_text: str) -> List[Dict]:
             key = (instrument_num, book, page)
 
             if key not in seen:
-                references.append({
-                    'instrument_number': instrument_num,
-                    'book': book,
-                    'page': page,
-                    'exists_in_db': None,  # Will be filled by cross-reference
-                    'target_id': None       # Will be filled by cross-reference
-                })
+                references.append(key)
                 seen.add(key)
 
     return references
@@ -208,7 +202,7 @@ def cross_reference_batch(conn, references: List[Tuple[int, int, int]]) -> Dict[
     if not references:
         return {}
 
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    cursor = conn.cursor()
 
     # Extract unique (book, page) pairs
     book_page_pairs = list(set((ref[1], ref[2]) for ref in references))
@@ -229,12 +223,12 @@ def cross_reference_batch(conn, references: List[Tuple[int, int, int]]) -> Dict[
     # Prefer matching by instrument_number if available
     lookup = {}
 
-    for row in results:
-        key = (row['book'], row['page'])
+    for rid, rbook, rpage, rinst in results:
+        key = (rbook, rpage)
 
         # If multiple records for same book/page, prefer exact instrument_number match
         if key not in lookup:
-            lookup[key] = row['id']
+            lookup[key] = rid
         else:
             # Keep the one that matches instrument_number if we find it later
             pass
@@ -242,42 +236,44 @@ def cross_reference_batch(conn, references: List[Tuple[int, int, int]]) -> Dict[
     cursor.close()
     return lookup
 
-def enrich_references(references: List[Dict], lookup: Dict[Tuple[int, int], int]) -> List[Dict]:
+def _fast_dump(references: List[Dict]) -> str:
     """
-    Enrich parsed references with database cross-reference data.
+    Serialize enriched references to JSON without going through json.dumps.
 
-    Args:
-        references: List of parsed references
-        lookup: Dictionary mapping (book, page) -> document_id
-
-    Returns:
-        Enriched references
+    Every reference has the same five keys holding ints, bools or None, so the
+    skeleton is written directly. Anything else falls back to json.dumps.
     """
-    for ref in references:
-        key = (ref['book'], ref['page'])
-
-        if key in lookup:
-            ref['exists_in_db'] = True
-            ref['target_id'] = lookup[key]
-        else:
-            ref['exists_in_db'] = False
-            ref['target_id'] = None
-
-    return references
+    try:
+        parts = []
+        for ref in references:
+            exists = ref['exists_in_db']
+            target_id = ref['target_id']
+            parts.append(
+                f'{{"instrument_number":{int(ref["instrument_number"])},'
+                f'"book":{int(ref["book"])},'
+                f'"page":{int(ref["page"])},'
+                f'"exists_in_db":{"true" if exists else "null" if exists is None else "false"},'
+                f'"target_id":{"null" if target_id is None else int(target_id)}}}'
+            )
+        return '[' + ','.join(parts) + ']'
+    except (KeyError, TypeError, ValueError):
+        return json.dumps(references)
 
 # ============================================================================
 # Processing Functions
 # ============================================================================
 
-def process_batch(conn, batch: List[Dict], dry_run: bool = False) -> Tuple[int, int, int]:
+def process_batch(conn, batch: List[Tuple[int, str]], dry_run: bool = False) -> Tuple[int, int, int]:
     """
     Process a batch of documents, parsing and enriching related_items.
 
     Args:
         conn: Database connection
-        batch: List of document records
+        batch: List of (id, related_items_raw) tuples
         dry_run: If True, don't write to database
 
+    Writes are left uncommitted; the caller commits once per commit window.
+
     Returns:
         Tuple of (processed, with_references, errors)
     """
@@ -287,12 +283,9 @@ def process_batch(conn, batch: List[Dict], dry_run: bool = False) -> Tuple[int,
 
     # Collect all references for batch cross-reference
     all_references = []
-    doc_references = {}  # doc_id -> parsed_references
-
-    for doc in batch:
-        doc_id = doc['id']
-        raw_text = doc['related_items_raw']
+    doc_references = {}  # doc_id -> [(instrument_number, book, page), ...]
 
+    for doc_id, raw_text in batch:
         try:
             # Parse references
             references = parse_related_item(raw_text)
@@ -302,8 +295,7 @@ def process_batch(conn, batch: List[Dict], dry_run: bool = False) -> Tuple[int,
                 doc_references[doc_id] = references
 
                 # Collect for batch lookup
-                for ref in references:
-                    all_references.append((ref['instrument_number'], ref['book'], ref['page']))
+                all_references.extend(references)
             else:
                 # No references, set to empty array
                 doc_references[doc_id] = []
@@ -315,15 +307,11 @@ def process_batch(conn, batch: List[Dict], dry_run: bool = False) -> Tuple[int,
             errors += 1
 
     # Batch cross-reference
+    lookup = {}
     if all_references:
         logger.debug(f"Cross-referencing {len(all_references)} references...")
         lookup = cross_reference_batch(conn, all_references)
 
-        # Enrich all references
-        for doc_id, references in doc_references.items():
-            if references:
-                doc_references[doc_id] = enrich_references(references, lookup)
-
     # Update database
     if not dry_run and doc_references:
         cursor = conn.cursor()
@@ -335,27 +323,41 @@ def process_batch(conn, batch: List[Dict], dry_run: bool = False) -> Tuple[int,
             WHERE id = %s
         """
 
+        # Reference dicts are built once here, already carrying the lookup result
         update_data = [
-            (json.dumps(references), doc_id)
+            (_fast_dump([
+                {
+                    'instrument_number': inst,
+                    'book': book,
+                    'page': page,
+                    'exists_in_db': (book, page) in lookup,
+                    'target_id': lookup.get((book, page)),
+                }
+                for inst, book, page in references
+            ]), doc_id)
             for doc_id, references in doc_references.items()
         ]
 
         execute_batch(cursor, update_query, update_data, page_size=100)
-        conn.commit()
         cursor.close()
 
     return processed, with_references, errors
 
-def process_all_documents(conn, batch_size: int = 1000, dry_run: bool = False):
+def process_all_documents(conn, batch_size: int = 1000, dry_run: bool = False,
+                          commit_size: int = 50000):
     """
     Process all documents with related_items.
 
+    Updates are committed every `commit_size` rows rather than every batch,
+    so each commit window pays for a single WAL flush.
+
     Args:
         conn: Database connection
         batch_size: Number of documents to process per batch
         dry_run: If True, don't write to database
+        commit_size: Number of processed rows per transaction
     """
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    cursor = conn.cursor()
 
     # Check which column to use (related_items_raw if exists, else related_items)
     cursor.execute("""
@@ -364,7 +366,7 @@ def process_all_documents(conn, batch_size: int = 1000, dry_run: bool = False):
         WHERE table_name='index_documents'
           AND column_name IN ('related_items_raw', 'related_items')
     """)
-    available_cols = [row['column_name'] for row in cursor.fetchall()]
+    available_cols = [row[0] for row in cursor.fetchall()]
 
     # Use related_items_raw if it exists, else fall back to related_items
     source_column = 'related_items_raw' if 'related_items_raw' in available_cols else 'related_items'
@@ -378,7 +380,7 @@ def process_all_documents(conn, batch_size: int = 1000, dry_run: bool = False):
           AND {source_column} != ''
     """)
 
-    total = cursor.fetchone()['count']
+    total = cursor.fetchone()[0]
     logger.info(f"Processing {total:,} documents with related_items")
 
     if total == 0:
@@ -391,9 +393,14 @@ def process_all_documents(conn, batch_size: int = 1000, dry_run: bool = False):
     total_errors = 0
 
     offset = 0
+    rows_since_commit = 0
 
     with tqdm(total=total, desc="Parsing related_items") as pbar:
         while offset < total:
+            if not dry_run and rows_since_commit == 0:
+                # Re-runnable job: losing the tail of a window on crash is fine
+                cursor.execute("SET LOCAL synchronous_commit = off")
+
             # Fetch batch
             cursor.execute(f"""
                 SELECT id, {source_column} as related_items_raw
@@ -410,11 +417,7 @@ def process_all_documents(conn, batch_size: int = 1000, dry_run: bool = False):
                 break
 
             # Process batch
-            processed, with_refs, errors = process_batch(
-                conn,
-                [dict(row) for row in batch],
-                dry_run
-            )
+            processed, with_refs, errors = process_batch(conn, batch, dry_run)
 
             total_processed += processed
             total_with_refs += with_refs
@@ -422,6 +425,14 @@ def process_all_documents(conn, batch_size: int = 1000, dry_run: bool = False):
 
             pbar.update(len(batch))
             offset += batch_size
+            rows_since_commit += len(batch)
+
+            if not dry_run and rows_since_commit >= commit_size:
+                conn.commit()
+                rows_since_commit = 0
+
+    if not dry_run:
+        conn.commit()
 
     cursor.close()
 
@@ -525,6 +536,8 @@ def main():
                        help='Show what would be done without making changes')
     parser.add_argument('--batch-size', type=int, default=1000,
                        help='Number of documents to process per batch (default: 1000)')
+    parser.add_argument('--commit-size', type=int, default=50000,
+                       help='Number of documents to update per transaction (default: 50000)')
     parser.add_argument('--stats-only', action='store_true',
                        help='Only generate statistics (requires data already parsed)')
 
@@ -553,7 +566,7 @@ def main():
             add_columns_if_needed(conn, args.dry_run)
 
             # Process all documents
-            process_all_documents(conn, args.batch_size, args.dry_run)
+            process_all_documents(conn, args.batch_size, args.dry_run, args.commit_size)
 
             # Generate statistics
             if not args.dry_run:
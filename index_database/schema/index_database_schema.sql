@@ -5,6 +5,18 @@
 -- Create database (run separately via gcloud)
 -- CREATE DATABASE madison_county_index;
 
+-- ============================================================================
+-- Download Error Messages
+-- ============================================================================
+-- Distinct download failure messages, referenced by
+-- index_documents.download_error_id so error summaries group on an integer
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS error_messages (
+    id SERIAL PRIMARY KEY,
+    message TEXT NOT NULL UNIQUE
+);
+
 -- ============================================================================
 -- Main Index Documents Table
 -- ============================================================================
@@ -103,6 +115,7 @@ CREATE TABLE IF NOT EXISTS index_documents (
     download_attempts INTEGER DEFAULT 0,
     downloaded_at TIMESTAMP,
     download_error TEXT,  -- Store error message if failed
+    download_error_id INTEGER REFERENCES error_messages(id),  -- Failure message, for grouping
 
     -- Google Cloud Storage path
     gcs_path TEXT,  -- Path to uploaded document in GCS
@@ -136,6 +149,26 @@ CREATE INDEX idx_download_status_pending ON index_documents(download_status, boo
     WHERE download_status = 'pending';
 CREATE INDEX idx_download_failed ON index_documents(download_status, download_attempts)
     WHERE download_status = 'failed';
+CREATE INDEX idx_completed_book ON index_documents(book)  -- identify_gaps
+    WHERE download_status = 'completed';
+-- Matches QUEUE_KEY_SQL in download_queue_manager.py (fetch_next_batch order)
+CREATE INDEX idx_pending_queue ON index_documents(
+        COALESCE(download_priority, 2147483647),
+        COALESCE(book, 2147483647),
+        COALESCE(page, 2147483647),
+        id
+    )
+    WHERE download_status = 'pending';
+CREATE INDEX idx_in_progress_updated_at ON index_documents(updated_at)  -- stale claim reset
+    WHERE download_status = 'in_progress';
+CREATE INDEX idx_completed_downloaded_at ON index_documents(downloaded_at)  -- throughput
+    WHERE download_status = 'completed';
+CREATE INDEX idx_processed_updated_at ON index_documents(updated_at)  -- stage progress
+    WHERE download_status IN ('completed', 'in_progress');
+CREATE INDEX idx_docs_failed_recent ON index_documents(updated_at DESC, download_error_id)  -- recent errors
+    WHERE download_status = 'failed';
+CREATE INDEX idx_failed_error ON index_documents(download_error_id)  -- error summaries
+    WHERE download_status = 'failed' AND download_error_id IS NOT NULL;
 
 -- Document type classification
 CREATE INDEX idx_document_type ON index_documents(document_type) WHERE document_type IS NOT NULL;
@@ -143,6 +176,7 @@ CREATE INDEX idx_instrument_type_parsed ON index_documents(instrument_type_parse
 
 -- Date-based queries
 CREATE INDEX idx_file_date ON index_documents(file_date) WHERE file_date IS NOT NULL;
+CREATE INDEX idx_import_date ON index_documents(import_date);  -- imported_today stats
 
 -- Party name searches (for validation)
 CREATE INDEX idx_grantor ON index_documents USING gin(to_tsvector('english', grantor_party))
@@ -177,6 +211,125 @@ CREATE TRIGGER update_index_documents_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- ============================================================================
+-- Trigger-maintained row counts (read by update_index_data.py statistics and
+-- the download_validator.py reports)
+-- ============================================================================
+-- Existing databases: run add_stats_rollup.sql, which also seeds the counts
+
+-- Row counts per (source, download_status, download_priority), split over
+-- slots: each backend adds into slot pg_backend_pid() % 32, so concurrent
+-- download workers rarely wait on the same counter row. Readers SUM(n) over
+-- the slots. NULL status is stored as 'unknown', NULL priority as 0.
+CREATE TABLE index_documents_counters (
+    source VARCHAR(50) NOT NULL,
+    download_status VARCHAR(50) NOT NULL,
+    download_priority INTEGER NOT NULL DEFAULT 0,
+    slot SMALLINT NOT NULL DEFAULT 0,
+    n BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, download_status, download_priority, slot)
+);
+
+-- Inserts and deletes are counted per statement from the transition table,
+-- so a bulk load touches each counter row once. Updates are counted per row
+-- and the trigger only fires when source, status or priority actually changes,
+-- so the updates that touch none of them skip it and no transition tables are
+-- built.
+CREATE OR REPLACE FUNCTION index_documents_counters_apply()
+RETURNS TRIGGER AS $$
+DECLARE
+    s SMALLINT := pg_backend_pid() % 32;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM index_documents_counters;
+    ELSIF TG_OP = 'INSERT' THEN
+        INSERT INTO index_documents_counters AS c (source, download_status, download_priority, slot, n)
+        SELECT source, COALESCE(download_status, 'unknown'), COALESCE(download_priority, 0), s, COUNT(*)
+        FROM new_rows
+        GROUP BY 1, 2, 3
+        ON CONFLICT (source, download_status, download_priority, slot) DO UPDATE SET n = c.n + EXCLUDED.n;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO index_documents_counters AS c (source, download_status, download_priority, slot, n)
+        SELECT source, COALESCE(download_status, 'unknown'), COALESCE(download_priority, 0), s, -COUNT(*)
+        FROM old_rows
+        GROUP BY 1, 2, 3
+        ON CONFLICT (source, download_status, download_priority, slot) DO UPDATE SET n = c.n + EXCLUDED.n;
+    ELSE
+        INSERT INTO index_documents_counters AS c (source, download_status, download_priority, slot, n)
+        VALUES
+            (OLD.source, COALESCE(OLD.download_status, 'unknown'), COALESCE(OLD.download_priority, 0), s, -1),
+            (NEW.source, COALESCE(NEW.download_status, 'unknown'), COALESCE(NEW.download_priority, 0), s, 1)
+        ON CONFLICT (source, download_status, download_priority, slot) DO UPDATE SET n = c.n + EXCLUDED.n;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER index_documents_counters_insert
+    AFTER INSERT ON index_documents
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION index_documents_counters_apply();
+
+CREATE TRIGGER index_documents_counters_update
+    AFTER UPDATE OF download_status, source, download_priority ON index_documents
+    FOR EACH ROW
+    WHEN (OLD.download_status IS DISTINCT FROM NEW.download_status
+          OR OLD.source IS DISTINCT FROM NEW.source
+          OR OLD.download_priority IS DISTINCT FROM NEW.download_priority)
+    EXECUTE FUNCTION index_documents_counters_apply();
+
+CREATE TRIGGER index_documents_counters_delete
+    AFTER DELETE ON index_documents
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION index_documents_counters_apply();
+
+CREATE TRIGGER index_documents_counters_truncate
+    AFTER TRUNCATE ON index_documents
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION index_documents_counters_apply();
+
+-- ============================================================================
+-- Download progress materialized views (read by download_validator.py)
+-- ============================================================================
+-- Refreshed on demand by the reports once older than a minute (or from cron
+-- with download_validator.py --refresh-views)
+-- Existing databases: run add_download_progress_views.sql
+
+-- When each progress view was last refreshed (shown in the reports). A view
+-- with no row here is refreshed by the next report.
+CREATE TABLE progress_view_refreshes (
+    view_name TEXT PRIMARY KEY,
+    refreshed_at TIMESTAMP NOT NULL
+);
+
+-- Completions (by downloaded_at) and failures (by updated_at) per minute
+-- over the last 8 days
+CREATE MATERIALIZED VIEW mv_download_throughput AS
+SELECT
+    bucket,
+    SUM(completed)::bigint AS completed,
+    SUM(failed)::bigint AS failed
+FROM (
+    SELECT date_trunc('minute', downloaded_at) AS bucket, COUNT(*) AS completed, 0 AS failed
+    FROM index_documents
+    WHERE download_status = 'completed'
+      AND downloaded_at > CURRENT_TIMESTAMP - INTERVAL '8 days'
+    GROUP BY 1
+    UNION ALL
+    SELECT date_trunc('minute', updated_at), 0, COUNT(*)
+    FROM index_documents
+    WHERE download_status = 'failed'
+      AND updated_at > CURRENT_TIMESTAMP - INTERVAL '8 days'
+    GROUP BY 1
+) b
+GROUP BY bucket;
+
+CREATE UNIQUE INDEX idx_mv_download_throughput
+    ON mv_download_throughput(bucket);
+
 -- ============================================================================
 -- Useful Views for Reporting
 -- ============================================================================
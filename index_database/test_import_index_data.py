@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test insert_batch's duplicate collapsing and its switch between multi-row
+INSERT and COPY.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import import_index_data
+from import_index_data import (
+    COPY_THRESHOLD,
+    INSERT_COLUMNS,
+    IndexDatabase,
+    collapse_duplicate_rows,
+)
+
+
+def record(book, page, source_file, source='DuProcess', **fields):
+    return dict(fields, book=book, page=page, source=source, source_file=source_file)
+
+
+def column(rows, name):
+    index = INSERT_COLUMNS.index(name)
+    return [row[index] for row in rows]
+
+
+def test_last_duplicate_source_file_wins():
+    """A repeated (book, page, source) keeps its first fields and the last source_file."""
+    rows = collapse_duplicate_rows([
+        record(100, 1, '2025-01.xlsx', grantor_party='SMITH'),
+        record(100, 1, '2025-02.xlsx', grantor_party='JONES'),
+        record(100, 1, '2025-03.xlsx', grantor_party='BROWN'),
+    ])
+
+    assert len(rows) == 1
+    assert column(rows, 'source_file') == ['2025-03.xlsx']
+    assert column(rows, 'grantor_party') == ['SMITH']
+
+
+def test_input_order_is_kept():
+    """Rows come out in the order each key first appears; source is part of the key."""
+    rows = collapse_duplicate_rows([
+        record(300, 5, 'a.xlsx'),
+        record(100, 1, 'a.xlsx'),
+        record(300, 5, 'b.xlsx'),
+        record(100, 1, 'a.xlsx', source='Historical'),
+        record(200, 9, 'b.xlsx'),
+    ])
+
+    assert list(zip(column(rows, 'book'), column(rows, 'page'), column(rows, 'source'))) == [
+        (300, 5, 'DuProcess'),
+        (100, 1, 'DuProcess'),
+        (100, 1, 'Historical'),
+        (200, 9, 'DuProcess'),
+    ]
+    assert column(rows, 'source_file') == ['b.xlsx', 'a.xlsx', 'a.xlsx', 'b.xlsx']
+
+
+class _Conn:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def _insert_path(row_count: int) -> str:
+    """Run insert_batch with the database calls replaced; return which path ran."""
+    calls = []
+    db = IndexDatabase({})
+    db.conn = _Conn()
+    db._copy_batch = lambda values: calls.append('copy') or [('DuProcess', True)] * len(values)
+
+    def fake_execute_values(cursor, sql, values, page_size, fetch):
+        calls.append('insert')
+        return [('DuProcess', True)] * len(values)
+
+    original = import_index_data.execute_values
+    import_index_data.execute_values = fake_execute_values
+    try:
+        inserted = db.insert_batch([record(1, page, 'a.xlsx') for page in range(row_count)])
+    finally:
+        import_index_data.execute_values = original
+
+    assert inserted == {'DuProcess': row_count}
+    return calls[0]
+
+
+def test_copy_only_above_threshold():
+    """Batches up to COPY_THRESHOLD rows use execute_values; larger ones use COPY."""
+    assert _insert_path(COPY_THRESHOLD) == 'insert'
+    assert _insert_path(COPY_THRESHOLD + 1) == 'copy'
+
+
+if __name__ == '__main__':
+    test_last_duplicate_source_file_wins()
+    test_input_order_is_kept()
+    test_copy_only_above_threshold()
+    print("✓ insert_batch collapses duplicates and switches to COPY above the threshold")
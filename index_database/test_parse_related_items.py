@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test that _fast_dump produces the same JSON as json.dumps for related_items.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from parse_related_items import _fast_dump, parse_related_item
+
+
+def test_fast_dump_matches_json_dumps():
+    """Fast serializer must round-trip to the same value as json.dumps."""
+    cases = [
+        [],
+        [
+            {'instrument_number': inst, 'book': book, 'page': page,
+             'exists_in_db': None, 'target_id': None}
+            for inst, book, page in parse_related_item("945431 bk:4140/753")
+        ],
+        [
+            {'instrument_number': 945431, 'book': 4140, 'page': 753,
+             'exists_in_db': True, 'target_id': 571625},
+            {'instrument_number': 12, 'book': 238, 'page': 1,
+             'exists_in_db': False, 'target_id': None},
+        ],
+    ]
+
+    for refs in cases:
+        assert json.loads(_fast_dump(refs)) == json.loads(json.dumps(refs)), refs
+
+
+def test_fast_dump_falls_back_on_unexpected_shape():
+    """References missing keys are serialized by json.dumps instead."""
+    refs = [{'instrument_number': 1, 'book': 2}]
+    assert _fast_dump(refs) == json.dumps(refs)
+
+
+if __name__ == '__main__':
+    test_fast_dump_matches_json_dumps()
+    test_fast_dump_falls_back_on_unexpected_shape()
+    print("✓ _fast_dump matches json.dumps")
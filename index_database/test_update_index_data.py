@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test that apply_insert_counts derives the same statistics a fresh
+get_database_stats() would return after an import.
+"""
+
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from index_database.update_index_data import apply_insert_counts
+
+
+BEFORE = {
+    'total_records': 10,
+    'by_source': {'DuProcess': 7, 'Historical': 3},
+    'by_status': {'pending': 4, 'completed': 6},
+    'imported_today': 2,
+}
+
+
+def test_new_rows_add_to_source_status_and_totals():
+    """Inserted rows count toward their source, 'pending', and the totals."""
+    after = apply_insert_counts(BEFORE, Counter({'DuProcess': 5, 'MID': 2}))
+
+    assert after == {
+        'total_records': 17,
+        'by_source': {'DuProcess': 12, 'Historical': 3, 'MID': 2},
+        'by_status': {'pending': 11, 'completed': 6},
+        'imported_today': 9,
+    }
+
+
+def test_missing_pending_key_is_created():
+    """A database with no pending rows before the import gains the key."""
+    before = dict(BEFORE, by_status={'completed': 10})
+    after = apply_insert_counts(before, Counter({'DuProcess': 3}))
+
+    assert after['by_status'] == {'completed': 10, 'pending': 3}
+
+
+def test_empty_counter_leaves_stats_unchanged():
+    """Updates only (nothing inserted) match the before snapshot exactly."""
+    after = apply_insert_counts(BEFORE, Counter())
+
+    assert after == BEFORE
+    assert 'pending' not in apply_insert_counts(
+        dict(BEFORE, by_status={'completed': 10}), Counter()
+    )['by_status']
+
+
+def test_before_snapshot_is_not_modified():
+    """The before dict is printed alongside the result, so it must not change."""
+    before = {
+        'total_records': 1,
+        'by_source': {'DuProcess': 1},
+        'by_status': {'pending': 1},
+        'imported_today': 0,
+    }
+    apply_insert_counts(before, Counter({'DuProcess': 1}))
+
+    assert before['by_source'] == {'DuProcess': 1}
+    assert before['by_status'] == {'pending': 1}
+
+
+if __name__ == '__main__':
+    test_new_rows_add_to_source_status_and_totals()
+    test_missing_pending_key_is_created()
+    test_empty_counter_leaves_stats_unchanged()
+    test_before_snapshot_is_not_modified()
+    print("✓ apply_insert_counts matches the expected statistics")
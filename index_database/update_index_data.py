@@ -24,11 +24,16 @@ Usage:
 
 import sys
 import os
+import hashlib
 import logging
+import pickle
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Tuple
 import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -39,11 +44,13 @@ from tqdm import tqdm
 
 # Import from existing import script
 from index_database.import_index_data import (
+    DB_CONFIG,
     DUPROCESS_TYPE_MAPPING,
+    IndexDatabase,
     parse_instrument_type,
-    connect_db,
-    load_duprocess_file,
-    DatabaseManager
+    _drop_secondary_indexes,
+    _recreate_indexes,
+    load_duprocess_file
 )
 
 # ============================================================================
@@ -53,7 +60,18 @@ from index_database.import_index_data import (
 BASE_DIR = Path(__file__).parent.parent
 DUPROCESS_DIR = BASE_DIR / 'madison_docs' / 'DuProcess Indexes'
 LOG_FILE = Path(__file__).parent / 'index_update.log'
+# Records per insert_batch call, regardless of file boundaries (sent via COPY)
+INSERT_CHUNK_ROWS = 50000
 TRACKING_FILE = Path(__file__).parent / '.last_import_time'
+PARSE_CACHE_DIR = Path(__file__).parent / '.parse_cache'
+# Parse cache entries unused for this long are deleted
+PARSE_CACHE_MAX_AGE_DAYS = 30
+# Hash of the parsing code; part of every parse cache key, so a change to
+# load_duprocess_file (or anything else in import_index_data.py) invalidates
+# records parsed by the old version
+PARSER_VERSION = hashlib.sha1(
+    (Path(__file__).parent / 'import_index_data.py').read_bytes()
+).hexdigest()[:12]
 
 # ============================================================================
 # Logging Setup
@@ -92,8 +110,16 @@ def save_import_time(timestamp: datetime):
     except Exception as e:
         logger.error(f"Could not save import time: {e}")
 
-def find_new_files(since: Optional[datetime] = None) -> List[Path]:
-    """Find DuProcess Excel files modified after the given timestamp."""
+def find_new_files(since: Optional[datetime] = None) -> List[Tuple[Path, os.stat_result]]:
+    """
+    Find DuProcess Excel files modified after the given timestamp.
+
+    Uses a single os.scandir pass; the stat result of each match is returned
+    alongside its path so callers can reuse it instead of stat-ing again.
+
+    Returns:
+        Sorted list of (path, stat_result) tuples
+    """
     if since is None:
         since = get_last_import_time()
 
@@ -101,18 +127,22 @@ def find_new_files(since: Optional[datetime] = None) -> List[Path]:
         logger.warning("No previous import time found. Use --pattern or --file instead.")
         return []
 
+    since_ts = since.timestamp()
     new_files = []
-    for file_path in DUPROCESS_DIR.glob('*.xlsx'):
-        # Skip temp files
-        if file_path.name.startswith('~$'):
-            continue
+    with os.scandir(DUPROCESS_DIR) as entries:
+        for entry in entries:
+            # Skip temp files and anything that is not an Excel file
+            if not entry.name.endswith('.xlsx') or entry.name.startswith('~$'):
+                continue
+            if not entry.is_file():
+                continue
 
-        # Check modification time
-        mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-        if mtime > since:
-            new_files.append(file_path)
+            # Check modification time
+            st = entry.stat()
+            if st.st_mtime > since_ts:
+                new_files.append((Path(entry.path), st))
 
-    return sorted(new_files)
+    return sorted(new_files, key=lambda item: item[0])
 
 def find_files_by_pattern(pattern: str) -> List[Path]:
     """Find DuProcess Excel files matching the given pattern."""
@@ -123,46 +153,191 @@ def find_files_by_pattern(pattern: str) -> List[Path]:
     return sorted(files)
 
 
+def load_duprocess_file_cached(file_path: Path) -> list:
+    """
+    load_duprocess_file with an on-disk cache keyed by (parser version, path,
+    mtime, size).
+
+    A --dry-run populates the cache, so the real import that follows (and any
+    re-import of unchanged files) skips the Excel parse.
+    """
+    st = file_path.stat()
+    key = hashlib.sha1(f"{file_path.resolve()}:{st.st_mtime_ns}:{st.st_size}".encode()).hexdigest()
+    cache_file = PARSE_CACHE_DIR / f"{PARSER_VERSION}-{key}.pkl"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                records = pickle.load(f)
+            # Touch on hit so prune_parse_cache ages entries by last use
+            os.utime(cache_file)
+            return records
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache for {file_path.name}: {e}")
+
+    records = load_duprocess_file(file_path)
+
+    if records:
+        try:
+            PARSE_CACHE_DIR.mkdir(exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Could not write parse cache for {file_path.name}: {e}")
+
+    return records
+
+def prune_parse_cache() -> int:
+    """
+    Delete parse cache entries written by another parser version, entries
+    unused for PARSE_CACHE_MAX_AGE_DAYS, and temp files left by killed runs.
+
+    Returns:
+        Number of files removed
+    """
+    if not PARSE_CACHE_DIR.exists():
+        return 0
+
+    cutoff = datetime.now().timestamp() - PARSE_CACHE_MAX_AGE_DAYS * 86400
+    removed = 0
+    with os.scandir(PARSE_CACHE_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            try:
+                current = (entry.name.startswith(f"{PARSER_VERSION}-")
+                           and entry.name.endswith('.pkl'))
+                if current and entry.stat().st_mtime >= cutoff:
+                    continue
+                os.unlink(entry.path)
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Could not prune parse cache entry {entry.name}: {e}")
+
+    if removed:
+        logger.info(f"Pruned {removed} stale parse cache entries")
+    return removed
+
+def iter_parsed_files(files: List[Path], desc: str):
+    """
+    Yield (file_path, records) for each file, parsing in worker processes.
+
+    Results arrive in file order, so the caller's database work on one file
+    overlaps with parsing of the files after it.
+    """
+    prune_parse_cache()
+    max_workers = max(1, (os.cpu_count() or 2) - 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(load_duprocess_file_cached, files, chunksize=1)
+        for file_path, records in tqdm(zip(files, results), total=len(files), desc=desc):
+            yield file_path, records
+
+
 # ============================================================================
 # Statistics
 # ============================================================================
 
+# Server-side prepared once per connection; later calls skip parse/plan
+STATS_STATEMENT = 'stats_counts'
+STATS_QUERY = """
+    SELECT
+        source,
+        download_status,
+        n,
+        (SELECT COUNT(*) FROM index_documents
+         WHERE import_date > NOW() - INTERVAL '24 hours')
+    FROM index_documents_counters
+"""
+
+def execute_prepared_stats(conn, cursor):
+    """EXECUTE the stats statement, preparing it first on this connection if needed."""
+    try:
+        cursor.execute(f"EXECUTE {STATS_STATEMENT}")
+    except psycopg2.Error as e:
+        if e.pgcode != '26000':  # invalid_sql_statement_name: not prepared yet
+            raise
+        conn.rollback()
+        cursor.execute(f"PREPARE {STATS_STATEMENT} AS {STATS_QUERY}")
+        cursor.execute(f"EXECUTE {STATS_STATEMENT}")
+
 def get_database_stats(conn) -> dict:
-    """Get current database statistics."""
+    """
+    Get current database statistics.
+
+    Counts come from the trigger-maintained index_documents_counters table
+    (see add_stats_rollup.sql); imported_today is a range scan on
+    idx_import_date. Falls back to a grouped scan of
+    index_documents if the counters have not been installed.
+    """
     cursor = conn.cursor()
 
-    stats = {}
-
-    # Total records
-    cursor.execute("SELECT COUNT(*) FROM index_documents")
-    stats['total_records'] = cursor.fetchone()[0]
-
-    # By source
-    cursor.execute("""
-        SELECT source, COUNT(*)
-        FROM index_documents
-        GROUP BY source
-    """)
-    stats['by_source'] = dict(cursor.fetchall())
-
-    # Download status
-    cursor.execute("""
-        SELECT download_status, COUNT(*)
-        FROM index_documents
-        GROUP BY download_status
-    """)
-    stats['by_status'] = dict(cursor.fetchall())
-
-    # Recent imports
-    cursor.execute("""
-        SELECT COUNT(*)
-        FROM index_documents
-        WHERE import_date > NOW() - INTERVAL '24 hours'
-    """)
-    stats['imported_today'] = cursor.fetchone()[0]
+    try:
+        execute_prepared_stats(conn, cursor)
+    except psycopg2.ProgrammingError:
+        conn.rollback()
+        logger.warning("index_documents_counters not found; scanning index_documents (run add_stats_rollup.sql)")
+        cursor.execute("""
+            SELECT
+                source,
+                download_status,
+                COUNT(*),
+                SUM(COUNT(*) FILTER (WHERE import_date > NOW() - INTERVAL '24 hours')) OVER ()
+            FROM index_documents
+            GROUP BY source, download_status
+        """)
 
+    total_records = 0
+    by_source = {}
+    by_status = {}
+    imported_today = 0
+
+    # Iterate the cursor directly rather than copying rows into a list first
+    for source, status, count, recent in cursor:
+        total_records += count
+        by_source[source] = by_source.get(source, 0) + count
+        by_status[status] = by_status.get(status, 0) + count
+        # Every row carries the same table-wide recent count
+        imported_today = recent
     cursor.close()
-    return stats
+
+    return {
+        'total_records': total_records,
+        'by_source': by_source,
+        'by_status': by_status,
+        'imported_today': int(imported_today),
+    }
+
+def apply_insert_counts(before: dict, inserted: Counter) -> dict:
+    """
+    Derive post-import statistics from the before snapshot and insert counts.
+
+    New rows always start as 'pending' with import_date = now, and updates
+    from ON CONFLICT change neither the source nor the status, so this matches
+    a fresh get_database_stats() without scanning again.
+
+    Args:
+        before: Statistics from get_database_stats() taken before the import
+        inserted: Newly inserted rows per source (from insert_batch)
+
+    Returns:
+        Statistics dict in the same shape as get_database_stats()
+    """
+    added = sum(inserted.values())
+    by_source = dict(before['by_source'])
+    for source, count in inserted.items():
+        by_source[source] = by_source.get(source, 0) + count
+    by_status = dict(before['by_status'])
+    if added:
+        by_status['pending'] = by_status.get('pending', 0) + added
+
+    return {
+        'total_records': before['total_records'] + added,
+        'by_source': by_source,
+        'by_status': by_status,
+        'imported_today': before['imported_today'] + added,
+    }
 
 def print_stats(before: dict, after: dict):
     """Print before/after statistics."""
@@ -176,22 +351,26 @@ def print_stats(before: dict, after: dict):
     print(f"  Change: +{after['total_records'] - before['total_records']:,}")
 
     print(f"\nBy Source:")
-    for source in set(list(before['by_source'].keys()) + list(after['by_source'].keys())):
-        before_count = before['by_source'].get(source, 0)
-        after_count = after['by_source'].get(source, 0)
+    before_sources, after_sources = before['by_source'], after['by_source']
+    for source in sorted(before_sources.keys() | after_sources.keys(), key=str):
+        before_count = before_sources.get(source, 0)
+        after_count = after_sources.get(source, 0)
         print(f"  {source:12} {before_count:8,} → {after_count:8,} (+{after_count - before_count:,})")
 
     print(f"\nDownload Status:")
-    for status in sorted(set(list(before['by_status'].keys()) + list(after['by_status'].keys()))):
-        before_count = before['by_status'].get(status, 0)
-        after_count = after['by_status'].get(status, 0)
-        print(f"  {status:12} {before_count:8,} → {after_count:8,}")
+    before_statuses, after_statuses = before['by_status'], after['by_status']
+    for status in sorted(before_statuses.keys() | after_statuses.keys(), key=str):
+        before_count = before_statuses.get(status, 0)
+        after_count = after_statuses.get(status, 0)
+        print(f"  {str(status):12} {before_count:8,} → {after_count:8,}")
 
 # ============================================================================
 # Main
 # ============================================================================
 
-def main():
+@lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description='Update Madison County Index Database with new DuProcess files',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -218,8 +397,14 @@ Examples:
 
     parser.add_argument('--dry-run', action='store_true', help='Show what would be imported without making changes')
     parser.add_argument('--force', action='store_true', help='Force import even if files were previously imported')
+    parser.add_argument('--fast', action='store_true',
+                        help='Drop secondary indexes during the load and rebuild them afterwards (large backfills; '
+                             'their definitions are kept in index_database/.dropped_indexes.sql until rebuilt)')
+
+    return parser
 
-    args = parser.parse_args()
+def main():
+    args = build_parser().parse_args()
 
     print("\n" + "="*70)
     print("Madison County Title Plant - Index Data Update")
@@ -227,11 +412,11 @@ Examples:
 
     # Determine files to import
     files_to_import = []
+    file_stats = {}
 
     if args.file:
-        file_path = Path(args.file)
-        if not file_path.is_absolute():
-            file_path = BASE_DIR / file_path
+        # Joining onto an absolute path yields that path unchanged
+        file_path = (BASE_DIR / args.file).resolve()
         if file_path.exists():
             files_to_import = [file_path]
         else:
@@ -248,7 +433,9 @@ Examples:
         last_import = get_last_import_time()
         if last_import:
             print(f"Last import: {last_import.strftime('%Y-%m-%d %H:%M:%S')}")
-            files_to_import = find_new_files(last_import)
+            new_files = find_new_files(last_import)
+            files_to_import = [file_path for file_path, _ in new_files]
+            file_stats = dict(new_files)
         else:
             logger.error("No previous import found. Use --pattern or --file for first import.")
             return 1
@@ -260,7 +447,8 @@ Examples:
     # Show files to be imported
     print(f"\nFiles to import ({len(files_to_import)}):")
     for f in files_to_import:
-        mtime = datetime.fromtimestamp(f.stat().st_mtime)
+        st = file_stats.get(f) or f.stat()
+        mtime = datetime.fromtimestamp(st.st_mtime)
         print(f"  - {f.name} (modified: {mtime.strftime('%Y-%m-%d %H:%M:%S')})")
 
     if args.dry_run:
@@ -273,10 +461,19 @@ Examples:
             print("Import cancelled.")
             return 0
 
+    # Handle dry run (parse only; the database is never touched)
+    if args.dry_run:
+        total_records = 0
+        for _, records in iter_parsed_files(files_to_import, "Analyzing files"):
+            total_records += len(records)
+
+        print(f"\n[DRY RUN] Would import {total_records:,} records from {len(files_to_import)} files")
+        return 0
+
     # Connect to database
+    db = IndexDatabase(DB_CONFIG)
     try:
-        db = DatabaseManager()
-        logger.info("Connected to database")
+        db.connect()
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         return 1
@@ -285,35 +482,52 @@ Examples:
     print("\nGathering database statistics...")
     before_stats = get_database_stats(db.conn)
 
-    # Handle dry run
-    if args.dry_run:
-        total_records = 0
-        for file_path in tqdm(files_to_import, desc="Analyzing files"):
-            records = load_duprocess_file(file_path)
-            total_records += len(records)
-
-        print(f"\n[DRY RUN] Would import {total_records:,} records from {len(files_to_import)} files")
-        db.close()
-        return 0
-
     # Process files
     print(f"\nProcessing {len(files_to_import)} files...")
 
     total_records = 0
+    inserted = Counter()
+    pending = []
+    dropped_indexes = []
+    load_error = None
+
+    # All files load in one transaction: one commit per run, and a failure
+    # leaves the table exactly as it was. Dropped indexes are rebuilt in the
+    # finally so an interrupt (Ctrl-C included) never leaves them missing.
+    try:
+        if args.fast:
+            dropped_indexes = _drop_secondary_indexes(db.conn)
+
+        for file_path, records in iter_parsed_files(files_to_import, "Importing files"):
+            if records:
+                pending.extend(records)
+                total_records += len(records)
+                logger.info(f"Parsed {file_path.name}: {len(records)} records")
+
+            if len(pending) >= INSERT_CHUNK_ROWS:
+                inserted += db.insert_batch(pending, commit=False)
+                pending = []
+
+        if pending:
+            inserted += db.insert_batch(pending, commit=False)
+        db.conn.commit()
+    except Exception as e:
+        db.conn.rollback()
+        load_error = e
+    finally:
+        if dropped_indexes:
+            _recreate_indexes(db.conn, dropped_indexes)
+
+    if load_error:
+        logger.error(f"Import failed, no changes were committed: {load_error}")
+        db.close()
+        return 1
 
-    for file_path in tqdm(files_to_import, desc="Importing files"):
-        records = load_duprocess_file(file_path)
-        if records:
-            db.insert_batch(records)
-            total_records += len(records)
-            logger.info(f"Imported {file_path.name}: {len(records)} records")
-
-    # Get after statistics
-    after_stats = get_database_stats(db.conn)
+    # Derive after statistics from this run's inserts instead of re-scanning
+    after_stats = apply_insert_counts(before_stats, inserted)
 
     # Update tracking file
-    if not args.dry_run:
-        save_import_time(datetime.now())
+    save_import_time(datetime.now())
 
     # Print results
     print("\n" + "="*70)
@@ -1,6 +1,6 @@
 """Document type definitions and fuzzy matching."""
 
-import re
+from functools import lru_cache
 from typing import Optional, Dict
 from difflib import SequenceMatcher
 
@@ -122,6 +122,10 @@ TRUNCATION_MAPPINGS = {
     'CERT DISCHARGE FEDERAL TAX LIE': 'CERT DISCHARGE FEDERAL TAX LIEN',
 }
 
+# The index truncates InstrumentType document types to this many characters
+# and then drops '&' (see TRUNCATION_MAPPINGS)
+INDEX_TYPE_WIDTH = 20
+
 class DocumentTypeResolver:
     """Resolve document types from instrument type strings."""
     
@@ -130,6 +134,29 @@ class DocumentTypeResolver:
         self.min_similarity = min_similarity
         self.document_types = DOCUMENT_TYPE_CODES
         self.truncation_mappings = TRUNCATION_MAPPINGS
+
+        # One matcher per canonical type. SequenceMatcher caches its analysis
+        # of the second sequence, so only the short input is re-indexed per
+        # comparison (not thread-safe; use one resolver per thread)
+        self._matchers = [
+            (full_type, SequenceMatcher(None, '', full_type))
+            for full_type in self.document_types
+        ]
+
+        # Resolve every truncation the index can produce up front, so the
+        # common miss is a dict hit instead of a scan of all types
+        self._truncated_matches: Dict[str, Optional[str]] = {}
+        for full_type in self.document_types:
+            head = full_type[:INDEX_TYPE_WIDTH]
+            for variant in (head.strip(), head.replace('&', '').strip()):
+                if variant and variant not in self.document_types:
+                    if variant not in self._truncated_matches:
+                        self._truncated_matches[variant] = self._best_fuzzy_match(variant)
+
+        # InstrumentType has a few hundred distinct values across millions of
+        # rows, so memoize the pure lookups per resolver instance
+        self.extract_document_type = lru_cache(maxsize=1024)(self.extract_document_type)
+        self.fuzzy_match_type = lru_cache(maxsize=1024)(self.fuzzy_match_type)
     
     def extract_document_type(self, instrument_type: str) -> Optional[str]:
         """
@@ -146,13 +173,14 @@ class DocumentTypeResolver:
         if not instrument_type:
             return None
         
-        # Extract part before " -"
-        match = re.match(r'^([^-]+)\s*-', str(instrument_type))
-        if match:
-            return match.group(1).strip()
+        # Extract part before the first dash (ignored when it leads the string)
+        text = str(instrument_type)
+        head, dash, _ = text.partition('-')
+        if dash and head:
+            return head.strip()
         
         # If no dash, return the whole string stripped
-        return str(instrument_type).strip()
+        return text.strip()
     
     def fuzzy_match_type(self, doc_type: str) -> tuple[str, str]:
         """
@@ -178,11 +206,32 @@ class DocumentTypeResolver:
             full_type = self.truncation_mappings[doc_type]
             return (full_type, self.document_types.get(full_type, '01'))
         
-        # Try fuzzy matching
+        # Known index truncation of a canonical type, else fuzzy matching
+        if doc_type in self._truncated_matches:
+            best_match = self._truncated_matches[doc_type]
+        else:
+            best_match = self._best_fuzzy_match(doc_type)
+        
+        if best_match:
+            return (best_match, self.document_types[best_match])
+        
+        # Default to DEED if no match found
+        return (doc_type, '01')
+    
+    def _best_fuzzy_match(self, doc_type: str) -> Optional[str]:
+        """
+        Find the closest standardized type by prefix or sequence similarity.
+        
+        Args:
+            doc_type: Upper-cased, stripped document type
+            
+        Returns:
+            Best matching standardized type, or None if nothing is close enough
+        """
         best_match = None
         best_score = 0
         
-        for full_type in self.document_types.keys():
+        for full_type, matcher in self._matchers:
             # Check if truncated type is a prefix
             if full_type.startswith(doc_type):
                 score = len(doc_type) / len(full_type)
@@ -190,17 +239,18 @@ class DocumentTypeResolver:
                     best_match = full_type
                     best_score = score
             else:
-                # Use sequence matcher for more complex matching
-                score = SequenceMatcher(None, doc_type, full_type).ratio()
+                # Use sequence matcher for more complex matching, skipping
+                # the full ratio() when its cheap upper bounds cannot win
+                matcher.set_seq1(doc_type)
+                floor = max(best_score, self.min_similarity)
+                if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                    continue
+                score = matcher.ratio()
                 if score > best_score and score >= self.min_similarity:
                     best_match = full_type
                     best_score = score
         
-        if best_match:
-            return (best_match, self.document_types[best_match])
-        
-        # Default to DEED if no match found
-        return (doc_type, '01')
+        return best_match
     
     def process_instrument_type(self, instrument_type: str) -> dict:
         """
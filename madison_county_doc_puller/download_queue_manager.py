@@ -2,7 +2,7 @@
 Madison County Document Download - Queue Manager
 
 Manages the download queue from the index database, handling:
-- Fetching documents by stage and priority
+- Claiming documents by stage and priority (safe for concurrent workers)
 - Status tracking (pending → in_progress → completed/failed)
 - Checkpoint/resumability
 - Statistics and progress tracking
@@ -17,15 +17,69 @@ Usage:
         queue.mark_completed(doc['id'], gcs_path='/path/to/file.pdf')
 """
 
+import os
 import logging
+import time
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_batch, execute_values
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# Database Connection
+# ============================================================================
+
+# TCP keepalives turn a dead server into an OperationalError within about a
+# minute instead of a status UPDATE hanging on a half-open socket
+CONNECTION_OPTIONS = {
+    'connect_timeout': 10,
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 3,
+}
+
+# Queue worker connections also get session timeouts, so a stuck statement or
+# an abandoned transaction cannot hold locks on claimed rows. Reporting
+# connections go without: their aggregates may legitimately run longer.
+WORKER_CONNECTION_OPTIONS = {
+    **CONNECTION_OPTIONS,
+    'options': '-c statement_timeout=30000 -c idle_in_transaction_session_timeout=60000',
+}
+
+def connect_index_db(retries: int = 3, retry_delay: float = 2.0, worker: bool = True):
+    """
+    Connect to the index database, retrying transient connection failures.
+
+    Args:
+        retries: Connection attempts before giving up
+        retry_delay: Base delay in seconds, multiplied by the attempt number
+        worker: Apply the queue worker session timeouts
+            (WORKER_CONNECTION_OPTIONS); pass False for reporting connections
+
+    Returns:
+        psycopg2 connection
+    """
+    options = WORKER_CONNECTION_OPTIONS if worker else CONNECTION_OPTIONS
+    for attempt in range(1, retries + 1):
+        try:
+            return psycopg2.connect(
+                host=os.getenv('DB_HOST', '127.0.0.1'),
+                port=os.getenv('DB_PORT', 5432),
+                database=os.getenv('DB_NAME', 'madison_county_index'),
+                user=os.getenv('DB_USER'),
+                password=os.getenv('DB_PASSWORD'),
+                **options
+            )
+        except psycopg2.OperationalError as e:
+            if attempt == retries:
+                raise
+            logger.warning(f"Database connection failed (attempt {attempt}/{retries}): {e}")
+            time.sleep(retry_delay * attempt)
+
 # ============================================================================
 # Portal Routing
 # ============================================================================
@@ -54,6 +108,44 @@ def determine_portal(book: int) -> str:
     else:
         raise ValueError(f"Invalid book number: {book}")
 
+# Same rules as determine_portal, evaluated in SQL so whole batches come back
+# already routed
+PORTAL_SQL = """
+    CASE
+        WHEN book < 238 THEN 'historical'
+        WHEN book >= 238 AND book < 3972 THEN 'mid'
+        ELSE 'new'
+    END"""
+
+# Queue order, which doubles as the keyset cursor fetch_next_batch resumes
+# from. NULLs are folded to a sentinel that sorts last (where ORDER BY would
+# put them) so the row comparison never silently drops those documents; id
+# breaks ties between documents on the same book/page. idx_pending_queue in
+# index_database/add_download_queue_indexes.sql is built on these exact
+# expressions; keep the two in sync.
+QUEUE_NULLS_LAST = 2147483647
+QUEUE_KEY_SQL = (
+    f"COALESCE(download_priority, {QUEUE_NULLS_LAST}), "
+    f"COALESCE(book, {QUEUE_NULLS_LAST}), "
+    f"COALESCE(page, {QUEUE_NULLS_LAST}), "
+    "id"
+)
+
+def queue_key(doc: Dict) -> Tuple[int, int, int, int]:
+    """
+    Python-side value of QUEUE_KEY_SQL for a fetched document.
+
+    Args:
+        doc: Document record with download_priority, book, page and id
+
+    Returns:
+        Sort key tuple usable as the keyset cursor
+    """
+    def fold(value):
+        return QUEUE_NULLS_LAST if value is None else value
+
+    return (fold(doc['download_priority']), fold(doc['book']), fold(doc['page']), doc['id'])
+
 # ============================================================================
 # Stage Configuration
 # ============================================================================
@@ -150,6 +242,217 @@ STAGE_CONFIGS = {
     }
 }
 
+# ============================================================================
+# Prepared Status Updates
+# ============================================================================
+
+# Hot per-document UPDATEs, prepared once per connection so each call only
+# ships parameters instead of re-sending and re-planning the SQL text.
+# name -> (parameter types, statement)
+PREPARED_STATEMENTS = {
+    'queue_mark_in_progress': ('bigint[]', """
+        UPDATE index_documents
+        SET download_status = 'in_progress',
+            download_attempts = download_attempts + 1,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ANY($1)
+    """),
+    'queue_mark_completed': ('text, integer, integer, boolean, bigint', """
+        UPDATE index_documents
+        SET download_status = 'completed',
+            downloaded_at = CURRENT_TIMESTAMP,
+            gcs_path = $1,
+            actual_book = $2,
+            actual_page = $3,
+            book_page_mismatch = $4,
+            download_error = NULL,
+            download_error_id = NULL,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = $5
+    """),
+    # The retry decision is made server-side: download_attempts was already
+    # incremented when the document was claimed. The message is interned in
+    # error_messages; DO NOTHING takes no lock on an existing message row, so
+    # concurrent workers never wait on each other there, and the SELECT finds
+    # the id instead. (A message first inserted by a transaction that commits
+    # mid-statement is not visible yet; that row keeps only its text.)
+    'queue_mark_failed': ('boolean, integer, text, bigint', """
+        WITH err AS (
+            INSERT INTO error_messages (message) VALUES ($3)
+            ON CONFLICT (message) DO NOTHING
+            RETURNING id
+        )
+        UPDATE index_documents
+        SET download_status = CASE
+                WHEN $1 AND download_attempts < $2 THEN 'pending'
+                ELSE 'failed'
+            END,
+            download_error = $3,
+            download_error_id = COALESCE(
+                (SELECT id FROM err),
+                (SELECT id FROM error_messages WHERE message = $3)
+            ),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = $4
+        RETURNING download_status, download_attempts
+    """),
+    'queue_mark_skipped': ('text, bigint', """
+        UPDATE index_documents
+        SET download_status = 'skipped',
+            download_error = $1,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = $2
+    """),
+}
+
+# Used in place of the above until index_database/add_error_messages.sql has
+# been run: same parameters, but download_error_id is left alone
+UNINTERNED_STATEMENTS = {
+    'queue_mark_completed': ('text, integer, integer, boolean, bigint', """
+        UPDATE index_documents
+        SET download_status = 'completed',
+            downloaded_at = CURRENT_TIMESTAMP,
+            gcs_path = $1,
+            actual_book = $2,
+            actual_page = $3,
+            book_page_mismatch = $4,
+            download_error = NULL,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = $5
+    """),
+    'queue_mark_failed': ('boolean, integer, text, bigint', """
+        UPDATE index_documents
+        SET download_status = CASE
+                WHEN $1 AND download_attempts < $2 THEN 'pending'
+                ELSE 'failed'
+            END,
+            download_error = $3,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = $4
+        RETURNING download_status, download_attempts
+    """),
+}
+
+# Multi-row completion: execute_values expands VALUES %s so a whole page of
+# documents is one UPDATE statement. {clear_error_id} is filled in per queue
+# manager, empty when error_messages is not installed.
+MARK_COMPLETED_MANY_SQL = """
+    UPDATE index_documents AS d
+    SET download_status = 'completed',
+        downloaded_at = CURRENT_TIMESTAMP,
+        gcs_path = v.gcs_path,
+        actual_book = v.actual_book::integer,
+        actual_page = v.actual_page::integer,
+        book_page_mismatch = v.book_page_mismatch::boolean,
+        download_error = NULL,{clear_error_id}
+        updated_at = CURRENT_TIMESTAMP
+    FROM (VALUES %s) AS v(gcs_path, actual_book, actual_page, book_page_mismatch, id)
+    WHERE d.id = v.id::bigint
+"""
+
+# ============================================================================
+# Error Summaries
+# ============================================================================
+
+# True once index_database/add_error_messages.sql has been run. Until then
+# failures carry only download_error text and download_error_id stays NULL.
+ERROR_MESSAGES_INSTALLED_SQL = "to_regclass('error_messages') IS NOT NULL"
+
+def error_messages_installed(conn) -> bool:
+    """
+    Check whether failure messages are interned in error_messages.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        True if the error_messages table exists
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT {ERROR_MESSAGES_INSTALLED_SQL}")
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+def error_summary_sql(error_ids: bool, limit: int, window_hours: Optional[int] = None) -> str:
+    """
+    Build the query for the most common messages on failed documents.
+
+    Groups on the interned download_error_id when error_messages is installed,
+    and on the download_error text otherwise.
+
+    Args:
+        error_ids: Result of error_messages_installed
+        limit: Number of messages to return
+        window_hours: Only count failures updated within this many hours
+
+    Returns:
+        SQL yielding (download_error, count) rows, most frequent first
+    """
+    recent = (f" AND updated_at > CURRENT_TIMESTAMP - make_interval(hours => {int(window_hours)})"
+              if window_hours else "")
+
+    if not error_ids:
+        return f"""
+        SELECT
+            download_error,
+            COUNT(*) as count
+        FROM index_documents
+        WHERE download_status = 'failed'{recent}
+          AND download_error IS NOT NULL
+        GROUP BY download_error
+        ORDER BY count DESC
+        LIMIT {int(limit)}
+        """
+
+    return f"""
+        SELECT
+            e.message as download_error,
+            c.count
+        FROM (
+            SELECT download_error_id, COUNT(*) as count
+            FROM index_documents
+            WHERE download_status = 'failed'{recent}
+              AND download_error_id IS NOT NULL
+            GROUP BY download_error_id
+            ORDER BY count DESC
+            LIMIT {int(limit)}
+        ) c
+        JOIN error_messages e ON e.id = c.download_error_id
+        ORDER BY c.count DESC
+        """
+
+# ============================================================================
+# Completion Estimates
+# ============================================================================
+
+# Both counts in one round-trip; each subquery is a range over its own partial
+# index (idx_pending_queue, idx_completed_downloaded_at)
+PENDING_AND_RECENT_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM index_documents
+         WHERE download_status = 'pending'),
+        (SELECT COUNT(*) FROM index_documents
+         WHERE download_status = 'completed'
+           AND downloaded_at > CURRENT_TIMESTAMP - make_interval(hours => %s))
+"""
+
+def count_pending_and_recent(cursor, hours: int) -> Tuple[int, int]:
+    """
+    Count pending documents and documents completed in the last few hours.
+
+    Args:
+        cursor: Plain (tuple) cursor
+        hours: Size of the recent-completion window
+
+    Returns:
+        (pending, completed_recent) tuple
+    """
+    cursor.execute(PENDING_AND_RECENT_SQL, (hours,))
+    pending, completed_recent = cursor.fetchone()
+    return pending, completed_recent
+
 # ============================================================================
 # Download Queue Manager
 # ============================================================================
@@ -161,7 +464,12 @@ class DownloadQueueManager:
     Handles fetching documents, status tracking, checkpoints, and statistics.
     """
 
-    def __init__(self, conn, stage: str = 'stage-1-small', batch_size: int = 100):
+    STATS_TTL = 30.0  # Seconds get_queue_statistics results are reused
+    STAGE_COUNT_TTL = 60.0  # Seconds between recounts for the stage limit
+    MAX_ATTEMPTS = 5  # Download attempts before a failure is permanent
+
+    def __init__(self, conn, stage: str = 'stage-1-small', batch_size: int = 100,
+                 synchronous_commit: bool = False):
         """
         Initialize queue manager.
 
@@ -169,19 +477,99 @@ class DownloadQueueManager:
             conn: Database connection
             stage: Stage identifier (e.g., 'stage-1-small')
             batch_size: Number of documents to fetch per batch
+            synchronous_commit: Wait for the WAL flush on every status commit.
+                Off by default: a status lost in a server crash only means the
+                document is reset or downloaded again.
         """
         self.conn = conn
         self.stage = stage
         self.batch_size = batch_size
+        self.synchronous_commit = synchronous_commit
 
         if stage not in STAGE_CONFIGS:
             raise ValueError(f"Unknown stage: {stage}. Valid stages: {list(STAGE_CONFIGS.keys())}")
 
         self.config = STAGE_CONFIGS[stage]
-        self.last_fetched_id = None
+        self.last_cursor: Optional[Tuple[int, int, int, int]] = None
+        self._stats_cache: Optional[Dict] = None
+        self._stats_cached_at = 0.0
+        self._stage_processed: Optional[int] = None
+        self._stage_processed_at = 0.0
+
+        # Cursors are reused by every call instead of being opened and closed
+        # around each status update; close() releases them
+        self._cursor = self.conn.cursor()
+        self._dict_cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+
+        # The connection may be shared with the caller: only end the
+        # transaction opened here, never one the caller already has open
+        caller_transaction = (self.conn.get_transaction_status()
+                              != psycopg2.extensions.TRANSACTION_STATUS_IDLE)
+        self._error_ids = self._prepare_statements(self._cursor)
+        self._mark_completed_many_sql = MARK_COMPLETED_MANY_SQL.format(
+            clear_error_id="\n        download_error_id = NULL," if self._error_ids else ""
+        )
+        if not caller_transaction:
+            self.conn.commit()
 
         logger.info(f"Initialized queue manager for {self.config['name']}")
 
+    def close(self):
+        """Close the reused cursors. The connection itself belongs to the caller."""
+        self._cursor.close()
+        self._dict_cursor.close()
+
+    @staticmethod
+    def _prepare_statements(cursor) -> bool:
+        """
+        PREPARE the status UPDATEs on this connection unless already done.
+
+        Pooled connections outlive a queue manager, so statements prepared by
+        an earlier manager on the same session are reused. Without the
+        error_messages table the UNINTERNED_STATEMENTS variants are prepared,
+        so the downloader still runs before add_error_messages.sql is applied.
+
+        Args:
+            cursor: Cursor on the connection to prepare
+
+        Returns:
+            True if error_messages exists and failure messages are interned
+        """
+        cursor.execute(
+            f"""
+            SELECT
+                {ERROR_MESSAGES_INSTALLED_SQL},
+                ARRAY(SELECT name FROM pg_prepared_statements WHERE name = ANY(%s))
+            """,
+            (list(PREPARED_STATEMENTS),)
+        )
+        error_ids, existing = cursor.fetchone()
+
+        statements = dict(PREPARED_STATEMENTS)
+        if not error_ids:
+            logger.warning("error_messages table not found; failure messages are stored "
+                           "without ids (run index_database/add_error_messages.sql)")
+            statements.update(UNINTERNED_STATEMENTS)
+
+        for name, (arg_types, statement) in statements.items():
+            if name not in existing:
+                cursor.execute(f"PREPARE {name}({arg_types}) AS {statement}")
+
+        return error_ids
+
+    def _relax_commit(self, cursor):
+        """
+        Skip the WAL flush wait for the queue's current write transaction.
+
+        SET LOCAL, so it ends with the commit below it and never leaks into
+        other work on a shared or pooled connection.
+
+        Args:
+            cursor: Cursor the status update runs on
+        """
+        if not self.synchronous_commit:
+            cursor.execute("SET LOCAL synchronous_commit = off")
+
     def _build_filter_where_clause(self, include_status: bool = True) -> Tuple[str, List]:
         """
         Build WHERE clause based on stage configuration filters.
@@ -224,69 +612,112 @@ class DownloadQueueManager:
 
     def fetch_next_batch(self, limit: Optional[int] = None) -> List[Dict]:
         """
-        Fetch next batch of documents to download.
+        Claim the next batch of documents to download.
+
+        The batch is selected and marked in_progress (attempts incremented) in
+        one statement. Rows locked by another claimer are skipped, so
+        concurrent workers never receive the same document.
 
         Args:
             limit: Override batch size (optional)
 
         Returns:
-            List of document records as dictionaries
+            List of document records as dictionaries, in queue order
         """
         limit = limit or self.batch_size
-        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        cursor = self._dict_cursor
 
         # Build WHERE clause based on stage configuration
         where_clause, params = self._build_filter_where_clause(include_status=True)
         where_clauses = [where_clause]
 
-        # Resume from last checkpoint
-        if self.last_fetched_id:
-            where_clauses.append("id > %s")
-            params.append(self.last_fetched_id)
+        # Resume after the last document handed out, in queue order, so the
+        # scan seeks straight to the next key instead of filtering
+        if self.last_cursor:
+            where_clauses.append(f"({QUEUE_KEY_SQL}) > (%s, %s, %s, %s)")
+            params.extend(self.last_cursor)
 
         # Stage limit
         if self.config['limit']:
             # Check how many already processed in this stage
-            cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM index_documents
-                WHERE download_status IN ('completed', 'in_progress')
-                  AND updated_at > (CURRENT_TIMESTAMP - INTERVAL '7 days')
-            """)
-            processed = cursor.fetchone()['count']
+            processed = self._stage_processed_count()
 
             if processed >= self.config['limit']:
                 logger.info(f"Stage limit reached: {processed}/{self.config['limit']}")
-                cursor.close()
                 return []
 
         # Build query
         where_clause = " AND ".join(where_clauses)
         query = f"""
-            SELECT
-                id, source, book, page,
-                instrument_number,
-                instrument_type_parsed, document_type,
-                download_priority, download_attempts,
-                file_date, grantor_party, grantee_party
-            FROM index_documents
-            WHERE {where_clause}
-            ORDER BY download_priority, book, page
-            LIMIT %s
+            WITH claimed AS (
+                SELECT id
+                FROM index_documents
+                WHERE {where_clause}
+                ORDER BY {QUEUE_KEY_SQL}
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE index_documents d
+            SET download_status = 'in_progress',
+                download_attempts = d.download_attempts + 1,
+                updated_at = CURRENT_TIMESTAMP
+            FROM claimed
+            WHERE d.id = claimed.id
+            RETURNING
+                d.id, d.source, d.book, d.page,
+                d.instrument_number,
+                d.instrument_type_parsed, d.document_type,
+                d.download_priority, d.download_attempts,
+                d.file_date, d.grantor_party, d.grantee_party,
+                {PORTAL_SQL} AS portal
         """
         params.append(limit)
 
-        cursor.execute(query, params)
-        results = cursor.fetchall()
+        try:
+            self._relax_commit(cursor)
+            cursor.execute(query, params)
+            # RETURNING order is unspecified; restore queue order
+            results = sorted(cursor.fetchall(), key=queue_key)
+            self.conn.commit()
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
 
         if results:
-            self.last_fetched_id = results[-1]['id']
-            logger.info(f"Fetched {len(results)} documents (last ID: {self.last_fetched_id})")
+            if self._stage_processed is not None:
+                # Claimed rows are in_progress now, so they count toward the
+                # limit without another COUNT(*)
+                self._stage_processed += len(results)
+            self.last_cursor = queue_key(results[-1])
+            logger.info(f"Fetched {len(results)} documents (last ID: {results[-1]['id']})")
         else:
             logger.info("No more documents in queue")
 
-        cursor.close()
-        return [dict(row) for row in results]
+        return results
+
+    def _stage_processed_count(self) -> int:
+        """
+        Documents completed or in progress in the last 7 days, for the stage limit.
+
+        The count is taken from the database at most every STAGE_COUNT_TTL
+        seconds; in between, fetch_next_batch adds the rows it claims.
+
+        Returns:
+            Processed document count
+        """
+        if (self._stage_processed is None
+                or time.monotonic() - self._stage_processed_at >= self.STAGE_COUNT_TTL):
+            cursor = self._cursor
+            cursor.execute("""
+                SELECT COUNT(*) as count
+                FROM index_documents
+                WHERE download_status IN ('completed', 'in_progress')
+                  AND updated_at > (CURRENT_TIMESTAMP - INTERVAL '7 days')
+            """)
+            self._stage_processed = cursor.fetchone()[0]
+            self._stage_processed_at = time.monotonic()
+
+        return self._stage_processed
 
     def mark_in_progress(self, doc_id: int) -> bool:
         """
@@ -298,26 +729,73 @@ class DownloadQueueManager:
         Returns:
             True if successful
         """
-        cursor = self.conn.cursor()
+        return self.mark_in_progress_many([doc_id])
+
+    def mark_in_progress_many(self, doc_ids: List[int]) -> bool:
+        """
+        Mark several documents as in_progress in one statement and commit.
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            True if successful
+        """
+        if not doc_ids:
+            return True
+
+        cursor = self._cursor
+
+        try:
+            self._relax_commit(cursor)
+            cursor.execute("EXECUTE queue_mark_in_progress(%s)", (list(doc_ids),))
+
+            self.conn.commit()
+            return True
+
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Error marking {len(doc_ids)} doc(s) as in_progress: {e}")
+            return False
+
+    def release_batch(self, doc_ids: List[int]) -> int:
+        """
+        Return claimed documents that were never processed to 'pending'.
+
+        Undoes the attempt counted by fetch_next_batch, e.g. for the unused
+        tail of a batch when a stage limit is reached.
+
+        Args:
+            doc_ids: Document IDs claimed by fetch_next_batch
+
+        Returns:
+            Number of documents released
+        """
+        if not doc_ids:
+            return 0
+
+        cursor = self._cursor
 
         try:
+            self._relax_commit(cursor)
             cursor.execute("""
                 UPDATE index_documents
-                SET download_status = 'in_progress',
-                    download_attempts = download_attempts + 1,
+                SET download_status = 'pending',
+                    download_attempts = GREATEST(download_attempts - 1, 0),
                     updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """, (doc_id,))
+                WHERE id = ANY(%s)
+                  AND download_status = 'in_progress'
+            """, (list(doc_ids),))
 
+            count = cursor.rowcount
             self.conn.commit()
-            return True
+            logger.info(f"Released {count} unprocessed document(s) back to 'pending'")
+            return count
 
         except psycopg2.Error as e:
             self.conn.rollback()
-            logger.error(f"Error marking doc {doc_id} as in_progress: {e}")
-            return False
-        finally:
-            cursor.close()
+            logger.error(f"Error releasing {len(doc_ids)} doc(s): {e}")
+            return 0
 
     def mark_completed(self, doc_id: int, gcs_path: str, file_size_bytes: int = None,
                       checksum: str = None, actual_book: int = None, actual_page: int = None,
@@ -337,31 +815,58 @@ class DownloadQueueManager:
         Returns:
             True if successful
         """
-        cursor = self.conn.cursor()
+        return self.mark_completed_many([{
+            'doc_id': doc_id,
+            'gcs_path': gcs_path,
+            'actual_book': actual_book,
+            'actual_page': actual_page,
+            'book_page_mismatch': book_page_mismatch
+        }])
+
+    def mark_completed_many(self, completions: List[Dict]) -> bool:
+        """
+        Mark several documents as downloaded and commit.
+
+        A single document goes through the prepared statement; larger batches
+        are folded into one UPDATE ... FROM (VALUES ...) per 500 rows.
+
+        Args:
+            completions: Dicts with doc_id, gcs_path and optionally
+                actual_book, actual_page, book_page_mismatch (as for mark_completed)
+
+        Returns:
+            True if successful
+        """
+        if not completions:
+            return True
+
+        rows = [
+            (c['gcs_path'], c.get('actual_book'), c.get('actual_page'),
+             c.get('book_page_mismatch', False), c['doc_id'])
+            for c in completions
+        ]
+        cursor = self._cursor
 
         try:
-            cursor.execute("""
-                UPDATE index_documents
-                SET download_status = 'completed',
-                    downloaded_at = CURRENT_TIMESTAMP,
-                    gcs_path = %s,
-                    actual_book = %s,
-                    actual_page = %s,
-                    book_page_mismatch = %s,
-                    download_error = NULL,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """, (gcs_path, actual_book, actual_page, book_page_mismatch, doc_id))
+            self._relax_commit(cursor)
+            if len(rows) == 1:
+                cursor.execute("EXECUTE queue_mark_completed(%s, %s, %s, %s, %s)", rows[0])
+            else:
+                execute_values(
+                    cursor,
+                    self._mark_completed_many_sql,
+                    rows,
+                    template="(%s, %s, %s, %s, %s)",
+                    page_size=500
+                )
 
             self.conn.commit()
             return True
 
         except psycopg2.Error as e:
             self.conn.rollback()
-            logger.error(f"Error marking doc {doc_id} as completed: {e}")
+            logger.error(f"Error marking {len(completions)} doc(s) as completed: {e}")
             return False
-        finally:
-            cursor.close()
 
     def mark_failed(self, doc_id: int, error_message: str, retry: bool = True) -> bool:
         """
@@ -375,45 +880,73 @@ class DownloadQueueManager:
         Returns:
             True if successful
         """
-        cursor = self.conn.cursor()
+        cursor = self._cursor
 
-        # Determine if should retry based on attempt count
-        cursor.execute("SELECT download_attempts FROM index_documents WHERE id = %s", (doc_id,))
-        row = cursor.fetchone()
+        try:
+            self._relax_commit(cursor)
+            cursor.execute(
+                "EXECUTE queue_mark_failed(%s, %s, %s, %s)",
+                (retry, self.MAX_ATTEMPTS, error_message[:500], doc_id)  # Truncate error message
+            )
+            row = cursor.fetchone()
 
-        if not row:
-            cursor.close()
+            self.conn.commit()
+
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Error marking doc {doc_id} as failed: {e}")
             return False
 
-        attempts = row[0]
-        max_attempts = 5
+        if not row:
+            return False
 
-        # Set status based on retry logic
-        if retry and attempts < max_attempts:
-            status = 'pending'  # Will retry
-            logger.info(f"Doc {doc_id} failed (attempt {attempts}/{max_attempts}), will retry")
+        status, attempts = row
+        if status == 'pending':
+            logger.info(f"Doc {doc_id} failed (attempt {attempts}/{self.MAX_ATTEMPTS}), will retry")
         else:
-            status = 'failed'  # Permanent failure
             logger.warning(f"Doc {doc_id} permanently failed after {attempts} attempts")
 
+        return True
+
+    def mark_failed_many(self, failures: List[Tuple[int, str, bool]]) -> bool:
+        """
+        Mark several failed downloads in one transaction.
+
+        Args:
+            failures: (doc_id, error_message, retry) tuples
+
+        Returns:
+            True if successful
+        """
+        if not failures:
+            return True
+
+        # Message order, so workers inserting new messages take their
+        # error_messages locks in the same order
+        rows = sorted(
+            ((retry, self.MAX_ATTEMPTS, error_message[:500], doc_id)
+             for doc_id, error_message, retry in failures),
+            key=lambda row: row[2]
+        )
+        cursor = self._cursor
+
         try:
-            cursor.execute("""
-                UPDATE index_documents
-                SET download_status = %s,
-                    download_error = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """, (status, error_message[:500], doc_id))  # Truncate error message
+            self._relax_commit(cursor)
+            execute_batch(
+                cursor,
+                "EXECUTE queue_mark_failed(%s, %s, %s, %s)",
+                rows,
+                page_size=200
+            )
 
             self.conn.commit()
+            logger.info(f"Marked {len(failures)} doc(s) as failed")
             return True
 
         except psycopg2.Error as e:
             self.conn.rollback()
-            logger.error(f"Error marking doc {doc_id} as failed: {e}")
+            logger.error(f"Error marking {len(failures)} doc(s) as failed: {e}")
             return False
-        finally:
-            cursor.close()
 
     def mark_skipped(self, doc_id: int, reason: str) -> bool:
         """
@@ -426,16 +959,11 @@ class DownloadQueueManager:
         Returns:
             True if successful
         """
-        cursor = self.conn.cursor()
+        cursor = self._cursor
 
         try:
-            cursor.execute("""
-                UPDATE index_documents
-                SET download_status = 'skipped',
-                    download_error = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """, (reason[:500], doc_id))
+            self._relax_commit(cursor)
+            cursor.execute("EXECUTE queue_mark_skipped(%s, %s)", (reason[:500], doc_id))
 
             self.conn.commit()
             return True
@@ -444,61 +972,73 @@ class DownloadQueueManager:
             self.conn.rollback()
             logger.error(f"Error marking doc {doc_id} as skipped: {e}")
             return False
-        finally:
-            cursor.close()
 
-    def get_queue_statistics(self) -> Dict:
+    def get_queue_statistics(self, force: bool = False) -> Dict:
         """
         Get current queue statistics for this stage.
         Applies stage filters to show only documents relevant to this stage.
 
+        Results are reused for STATS_TTL seconds, so frequent checkpoints
+        don't rerun the aggregates.
+
+        Args:
+            force: Ignore any cached result and query now
+
         Returns:
             Dictionary with queue stats
         """
-        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        if (not force and self._stats_cache is not None
+                and time.monotonic() - self._stats_cached_at < self.STATS_TTL):
+            return self._stats_cache
+
+        cursor = self._dict_cursor
 
         stats = {}
 
         # Get base filter clause (without status)
         base_filter, base_params = self._build_filter_where_clause(include_status=False)
 
-        # Overall counts by status (filtered by stage)
-        query = f"""
-            SELECT download_status, COUNT(*) as count
-            FROM index_documents
-            WHERE {base_filter}
-            GROUP BY download_status
-        """
-        cursor.execute(query, base_params)
-        stats['by_status'] = {row['download_status']: row['count'] for row in cursor.fetchall()}
-
-        # By priority for pending (filtered by stage)
-        pending_filter, pending_params = self._build_filter_where_clause(include_status=True)
-        query = f"""
-            SELECT download_priority, COUNT(*) as count
-            FROM index_documents
-            WHERE {pending_filter}
-            GROUP BY download_priority
-            ORDER BY download_priority
-        """
-        cursor.execute(query, pending_params)
-        stats['pending_by_priority'] = {row['download_priority']: row['count'] for row in cursor.fetchall()}
-
-        # By portal for pending (filtered by stage)
+        # Counts by status, plus pending by priority and by portal, from one
+        # scan of the stage's rows. GROUPING() tells the sets apart:
+        # 3 = status only, 1 = status + priority, 2 = status + portal
         query = f"""
             SELECT
-                CASE
-                    WHEN book < 238 THEN 'historical'
-                    WHEN book >= 238 AND book < 3972 THEN 'mid'
-                    ELSE 'new'
-                END as portal,
+                download_status,
+                download_priority,
+                portal,
+                GROUPING(download_priority, portal) AS grouping_set,
                 COUNT(*) as count
-            FROM index_documents
-            WHERE {pending_filter}
-            GROUP BY portal
+            FROM (
+                SELECT download_status, download_priority, {PORTAL_SQL} AS portal
+                FROM index_documents
+                WHERE {base_filter}
+            ) stage_docs
+            GROUP BY GROUPING SETS (
+                (download_status),
+                (download_status, download_priority),
+                (download_status, portal)
+            )
         """
-        cursor.execute(query, pending_params)
-        stats['pending_by_portal'] = {row['portal']: row['count'] for row in cursor.fetchall()}
+        cursor.execute(query, base_params)
+
+        by_status, pending_by_priority, pending_by_portal = {}, {}, {}
+        for row in cursor.fetchall():
+            if row['grouping_set'] == 3:
+                by_status[row['download_status']] = row['count']
+            elif row['download_status'] != 'pending':
+                continue
+            elif row['grouping_set'] == 1:
+                pending_by_priority[row['download_priority']] = row['count']
+            else:
+                pending_by_portal[row['portal']] = row['count']
+
+        stats['by_status'] = by_status
+        # Ascending priority, NULL last (as ORDER BY download_priority)
+        stats['pending_by_priority'] = dict(sorted(
+            pending_by_priority.items(),
+            key=lambda item: (item[0] is None, item[0] or 0)
+        ))
+        stats['pending_by_portal'] = pending_by_portal
 
         # Recent activity (last hour)
         cursor.execute("""
@@ -511,19 +1051,10 @@ class DownloadQueueManager:
         """)
         stats['last_hour'] = {row['download_status']: row['count'] for row in cursor.fetchall()}
 
-        # Error summary
-        cursor.execute("""
-            SELECT
-                download_error,
-                COUNT(*) as count
-            FROM index_documents
-            WHERE download_status = 'failed'
-              AND download_error IS NOT NULL
-            GROUP BY download_error
-            ORDER BY count DESC
-            LIMIT 10
-        """)
-        stats['top_errors'] = [{'error': row['download_error'], 'count': row['count']} for row in cursor.fetchall()]
+        # Error summary (grouped on the interned message id when available)
+        cursor.execute(error_summary_sql(self._error_ids, limit=10))
+        stats['top_errors'] = [{'error': row['download_error'], 'count': row['count']}
+                               for row in cursor.fetchall()]
 
         # Book/page mismatch statistics
         cursor.execute("""
@@ -543,27 +1074,45 @@ class DownloadQueueManager:
             'mismatch_rate': (mismatch_data['mismatch_count'] / mismatch_data['total_validated'] * 100)
                 if mismatch_data['total_validated'] > 0 else 0
         }
+        # End the read transaction so the session doesn't sit idle in it
+        self.conn.commit()
 
-        cursor.close()
+        self._stats_cache = stats
+        self._stats_cached_at = time.monotonic()
         return stats
 
     def save_checkpoint(self) -> Dict:
         """
         Save current progress as checkpoint.
 
+        Only the resume position is recorded, so this is cheap enough to call
+        after every batch; queue statistics come from save_monitoring_snapshot().
+
         Returns:
             Checkpoint data
         """
         checkpoint = {
             'stage': self.stage,
             'timestamp': datetime.now().isoformat(),
-            'last_fetched_id': self.last_fetched_id,
-            'statistics': self.get_queue_statistics()
+            'last_cursor': list(self.last_cursor) if self.last_cursor else None
         }
 
-        logger.info(f"Checkpoint saved: ID={self.last_fetched_id}")
+        logger.info(f"Checkpoint saved: cursor={self.last_cursor}")
         return checkpoint
 
+    def save_monitoring_snapshot(self) -> Dict:
+        """
+        Bundle the queue statistics for dashboards and reports.
+
+        Returns:
+            Snapshot with stage, timestamp and get_queue_statistics() output
+        """
+        return {
+            'stage': self.stage,
+            'timestamp': datetime.now().isoformat(),
+            'statistics': self.get_queue_statistics()
+        }
+
     def load_checkpoint(self, checkpoint: Dict):
         """
         Resume from checkpoint.
@@ -574,8 +1123,12 @@ class DownloadQueueManager:
         if checkpoint['stage'] != self.stage:
             logger.warning(f"Checkpoint stage mismatch: {checkpoint['stage']} != {self.stage}")
 
-        self.last_fetched_id = checkpoint.get('last_fetched_id')
-        logger.info(f"Resumed from checkpoint: ID={self.last_fetched_id}")
+        # Checkpoints from before the keyset cursor only carry an id, which
+        # isn't a position in queue order; those restart from the top (the
+        # pending filter already skips finished documents)
+        last_cursor = checkpoint.get('last_cursor')
+        self.last_cursor = tuple(last_cursor) if last_cursor else None
+        logger.info(f"Resumed from checkpoint: cursor={self.last_cursor}")
 
     def reset_in_progress_records(self) -> int:
         """
@@ -585,7 +1138,7 @@ class DownloadQueueManager:
         Returns:
             Number of records reset
         """
-        cursor = self.conn.cursor()
+        cursor = self._cursor
 
         try:
             cursor.execute("""
@@ -608,8 +1161,6 @@ class DownloadQueueManager:
             self.conn.rollback()
             logger.error(f"Error resetting in_progress records: {e}")
             return 0
-        finally:
-            cursor.close()
 
     def estimate_completion(self) -> Dict:
         """
@@ -618,24 +1169,9 @@ class DownloadQueueManager:
         Returns:
             Dictionary with estimates
         """
-        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
-
-        # Get pending count
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM index_documents
-            WHERE download_status = 'pending'
-        """)
-        pending = cursor.fetchone()['count']
-
-        # Get throughput (last hour)
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM index_documents
-            WHERE download_status = 'completed'
-              AND downloaded_at > (CURRENT_TIMESTAMP - INTERVAL '1 hour')
-        """)
-        last_hour = cursor.fetchone()['count']
+        # Pending count and throughput (last hour)
+        pending, last_hour = count_pending_and_recent(self._cursor, hours=1)
+        self.conn.commit()
 
         # Calculate estimates
         estimates = {
@@ -646,5 +1182,4 @@ class DownloadQueueManager:
             'estimated_days_remaining': (pending / last_hour) / 24 if last_hour > 0 else None
         }
 
-        cursor.close()
         return estimates
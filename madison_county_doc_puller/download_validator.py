@@ -17,6 +17,10 @@ Usage:
 
     # Monitor download health
     python3 download_validator.py --monitor
+
+    # Refresh the report's materialized view now (the reports also refresh
+    # it themselves once it is stale)
+    python3 download_validator.py --refresh-views
 """
 
 import sys
@@ -29,6 +33,16 @@ from typing import Dict, List, Optional
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from madison_county_doc_puller.download_queue_manager import (  # noqa: E402
+    connect_index_db,
+    count_pending_and_recent,
+    error_messages_installed,
+    error_summary_sql
+)
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -50,14 +64,8 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 def connect_db():
-    """Connect to the index database."""
-    return psycopg2.connect(
-        host=os.getenv('DB_HOST', '127.0.0.1'),
-        port=os.getenv('DB_PORT', 5432),
-        database=os.getenv('DB_NAME', 'madison_county_index'),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD')
-    )
+    """Connect to the index database (keepalives and retries, no session timeouts)."""
+    return connect_index_db(worker=False)
 
 # ============================================================================
 # Validation Functions
@@ -73,31 +81,30 @@ def validate_pdf_file(file_path: str) -> bool:
     Returns:
         True if file appears to be a valid PDF
     """
+    # One open() and an fstat on the handle: on networked filesystems each
+    # exists()/stat() call is its own round-trip
     try:
-        path = Path(file_path)
-
-        if not path.exists():
-            return False
-
-        # Check file size (should be between 1KB and 50MB for typical documents)
-        size = path.stat().st_size
-        if size < 1000 or size > 50_000_000:
-            logger.warning(f"Unusual file size: {size:,} bytes for {file_path}")
-            return False
-
-        # Check PDF header
-        with open(path, 'rb') as f:
+        with open(file_path, 'rb') as f:
             header = f.read(5)
-            if not header.startswith(b'%PDF-'):
-                logger.warning(f"Invalid PDF header for {file_path}")
-                return False
+            size = os.fstat(f.fileno()).st_size
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        logger.error(f"Error validating {file_path}: {e}")
+        return False
 
-        return True
+    # Check PDF header
+    if not header.startswith(b'%PDF-'):
+        logger.warning(f"Invalid PDF header for {file_path}")
+        return False
 
-    except Exception as e:
-        logger.error(f"Error validating {file_path}: {e}")
+    # Check file size (should be between 1KB and 50MB for typical documents)
+    if size < 1000 or size > 50_000_000:
+        logger.warning(f"Unusual file size: {size:,} bytes for {file_path}")
         return False
 
+    return True
+
 def validate_download_batch(conn, doc_ids: List[int]) -> Dict:
     """
     Validate a batch of downloaded documents.
@@ -118,14 +125,18 @@ def validate_download_batch(conn, doc_ids: List[int]) -> Dict:
         'issues': []
     }
 
-    for doc_id in doc_ids:
-        cursor.execute("""
-            SELECT id, book, page, gcs_path, download_status
-            FROM index_documents
-            WHERE id = %s
-        """, (doc_id,))
+    # One query for the whole batch; a list parameter is sent as an array
+    cursor.execute("""
+        SELECT id, book, page, gcs_path, download_status
+        FROM index_documents
+        WHERE id = ANY(%s)
+    """, (list(doc_ids),))
+
+    docs = {row['id']: row for row in cursor.fetchall()}
+    cursor.close()
 
-        doc = cursor.fetchone()
+    for doc_id in doc_ids:
+        doc = docs.get(doc_id)
 
         if not doc:
             results['issues'].append({
@@ -159,44 +170,213 @@ def validate_download_batch(conn, doc_ids: List[int]) -> Dict:
 
         results['valid'] += 1
 
-    cursor.close()
     return results
 
 # ============================================================================
 # Monitoring Functions
 # ============================================================================
 
+# Materialized view from index_database/add_download_progress_views.sql.
+# Reports refresh it once it is older than VIEW_MAX_AGE_SECONDS, so a cron job
+# running --refresh-views is optional.
+PROGRESS_VIEWS = ('mv_download_throughput',)
+VIEW_MAX_AGE_SECONDS = 60
+
+def refresh_progress_views(conn) -> datetime:
+    """
+    Refresh the progress materialized views without blocking readers.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        The refresh time recorded in progress_view_refreshes
+    """
+    cursor = conn.cursor()
+    # A refresh rescans the recent tail of index_documents and may outlast a
+    # server-side statement timeout
+    cursor.execute("SET LOCAL statement_timeout = 0")
+    for view in PROGRESS_VIEWS:
+        cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}")
+        cursor.execute("""
+            INSERT INTO progress_view_refreshes (view_name, refreshed_at)
+            VALUES (%s, CURRENT_TIMESTAMP)
+            ON CONFLICT (view_name) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at
+            RETURNING refreshed_at
+        """, (view,))
+    refreshed_at = cursor.fetchone()[0]
+    conn.commit()
+    cursor.close()
+
+    return refreshed_at
+
+def refresh_stale_views(conn) -> Optional[datetime]:
+    """
+    Refresh the progress views if any is older than VIEW_MAX_AGE_SECONDS.
+
+    A report user that cannot refresh (the views belong to another role) gets
+    the existing contents and a warning.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        When the views were last refreshed, or None if they are not installed
+    """
+    cursor = conn.cursor()
+    try:
+        # A view with no row yet counts as stale
+        cursor.execute("""
+            SELECT
+                MIN(r.refreshed_at),
+                COUNT(r.refreshed_at) = cardinality(%(views)s::text[])
+                    AND MIN(r.refreshed_at) > CURRENT_TIMESTAMP - make_interval(secs => %(max_age)s)
+            FROM unnest(%(views)s::text[]) AS v(view_name)
+            LEFT JOIN progress_view_refreshes r USING (view_name)
+        """, {'views': list(PROGRESS_VIEWS), 'max_age': VIEW_MAX_AGE_SECONDS})
+        refreshed_at, fresh = cursor.fetchone()
+        conn.commit()
+    except psycopg2.ProgrammingError:
+        conn.rollback()
+        return None
+    finally:
+        cursor.close()
+
+    if fresh:
+        return refreshed_at
+
+    try:
+        return refresh_progress_views(conn)
+    except psycopg2.Error as e:
+        conn.rollback()
+        logger.warning(f"Could not refresh progress views, using the existing contents: {e}")
+        return refreshed_at
+
+def execute_from_views(conn, cursor, view_query: str, fallback_query: str, params=()):
+    """
+    Run a query against the progress views, or against index_documents if the
+    views have not been installed.
+
+    Args:
+        conn: Database connection
+        cursor: Cursor on conn
+        view_query: Query reading PROGRESS_VIEWS
+        fallback_query: Equivalent query over index_documents
+        params: Parameters shared by both queries
+    """
+    try:
+        cursor.execute(view_query, params)
+    except psycopg2.ProgrammingError:
+        conn.rollback()
+        logger.warning("Progress views not found; scanning index_documents (run add_download_progress_views.sql)")
+        cursor.execute(fallback_query, params)
+
+def get_status_breakdown(conn, cursor) -> List[Dict]:
+    """
+    Get document counts and percentages per download status.
+
+    Reads the trigger-maintained index_documents_counters table (see
+    index_database/add_stats_rollup.sql), so the cost does not grow with the
+    table. Falls back to a grouped scan if the counters are not installed.
+
+    Args:
+        conn: Database connection
+        cursor: RealDictCursor on conn
+
+    Returns:
+        Rows of download_status, count, percentage, largest first
+    """
+    try:
+        # The counters store a NULL status as 'unknown'
+        cursor.execute("""
+            SELECT
+                NULLIF(download_status, 'unknown') as download_status,
+                SUM(n) as count,
+                SUM(n) * 100.0 / SUM(SUM(n)) OVER () as percentage
+            FROM index_documents_counters
+            GROUP BY download_status
+            HAVING SUM(n) > 0
+            ORDER BY count DESC
+        """)
+    except psycopg2.ProgrammingError:
+        conn.rollback()
+        logger.warning("index_documents_counters not found; scanning index_documents")
+        cursor.execute("""
+            SELECT
+                download_status,
+                COUNT(*) as count,
+                COUNT(*) * 100.0 / SUM(COUNT(*)) OVER () as percentage
+            FROM index_documents
+            GROUP BY download_status
+            ORDER BY count DESC
+        """)
+
+    return cursor.fetchall()
+
+def get_priority_breakdown(conn, cursor) -> List[Dict]:
+    """
+    Get document counts per download priority and status.
+
+    Reads index_documents_counters like get_status_breakdown, falling back to
+    a grouped scan if the counters are not installed.
+
+    Args:
+        conn: Database connection
+        cursor: RealDictCursor on conn
+
+    Returns:
+        Rows of download_priority, download_status, count, by priority
+    """
+    try:
+        # The counters store a NULL priority as 0
+        cursor.execute("""
+            SELECT
+                download_priority,
+                NULLIF(download_status, 'unknown') as download_status,
+                SUM(n) as count
+            FROM index_documents_counters
+            WHERE download_priority <> 0
+            GROUP BY 1, 2
+            HAVING SUM(n) > 0
+            ORDER BY 1, 2
+        """)
+    except psycopg2.ProgrammingError:
+        conn.rollback()
+        logger.warning("index_documents_counters not found; scanning index_documents")
+        cursor.execute("""
+            SELECT
+                download_priority,
+                download_status,
+                COUNT(*) as count
+            FROM index_documents
+            WHERE download_priority IS NOT NULL
+            GROUP BY download_priority, download_status
+            ORDER BY download_priority, download_status
+        """)
+
+    return cursor.fetchall()
+
 def get_download_progress(conn) -> Dict:
     """Get overall download progress statistics."""
     cursor = conn.cursor(cursor_factory=RealDictCursor)
 
     # Overall status counts
-    cursor.execute("""
-        SELECT
-            download_status,
-            COUNT(*) as count,
-            COUNT(*) * 100.0 / SUM(COUNT(*)) OVER () as percentage
-        FROM index_documents
-        GROUP BY download_status
-        ORDER BY count DESC
-    """)
-    status_breakdown = [dict(row) for row in cursor.fetchall()]
+    status_breakdown = get_status_breakdown(conn, cursor)
 
     # By priority
-    cursor.execute("""
-        SELECT
-            download_priority,
-            download_status,
-            COUNT(*) as count
-        FROM index_documents
-        WHERE download_priority IS NOT NULL
-        GROUP BY download_priority, download_status
-        ORDER BY download_priority, download_status
-    """)
-    priority_breakdown = [dict(row) for row in cursor.fetchall()]
+    priority_breakdown = get_priority_breakdown(conn, cursor)
 
     # Recent activity (last 24 hours)
-    cursor.execute("""
+    execute_from_views(conn, cursor, """
+        SELECT
+            DATE_TRUNC('hour', bucket) as hour,
+            SUM(completed) as count
+        FROM mv_download_throughput
+        WHERE bucket > CURRENT_TIMESTAMP - INTERVAL '24 hours'
+        GROUP BY hour
+        HAVING SUM(completed) > 0
+        ORDER BY hour DESC
+    """, """
         SELECT
             DATE_TRUNC('hour', downloaded_at) as hour,
             COUNT(*) as count
@@ -206,21 +386,11 @@ def get_download_progress(conn) -> Dict:
         GROUP BY hour
         ORDER BY hour DESC
     """)
-    hourly_activity = [dict(row) for row in cursor.fetchall()]
+    hourly_activity = cursor.fetchall()
 
-    # Error summary
-    cursor.execute("""
-        SELECT
-            download_error,
-            COUNT(*) as count
-        FROM index_documents
-        WHERE download_status = 'failed'
-          AND download_error IS NOT NULL
-        GROUP BY download_error
-        ORDER BY count DESC
-        LIMIT 20
-    """)
-    error_summary = [dict(row) for row in cursor.fetchall()]
+    # Error summary (grouped on the interned message id when available)
+    cursor.execute(error_summary_sql(error_messages_installed(conn), limit=20))
+    error_summary = cursor.fetchall()
 
     cursor.close()
 
@@ -244,14 +414,21 @@ def calculate_throughput(conn, hours: int = 24) -> Dict:
     """
     cursor = conn.cursor(cursor_factory=RealDictCursor)
 
-    cursor.execute("""
+    execute_from_views(conn, cursor, """
+        SELECT
+            COALESCE(SUM(completed), 0)::bigint as completed,
+            COALESCE(SUM(completed), 0) / %s::float as per_hour,
+            COALESCE(SUM(completed), 0) / (%s::float * 60) as per_minute
+        FROM mv_download_throughput
+        WHERE bucket > CURRENT_TIMESTAMP - make_interval(hours => %s)
+    """, """
         SELECT
             COUNT(*) as completed,
             COUNT(*) / %s::float as per_hour,
             COUNT(*) / (%s::float * 60) as per_minute
         FROM index_documents
         WHERE download_status = 'completed'
-          AND downloaded_at > CURRENT_TIMESTAMP - INTERVAL '%s hours'
+          AND downloaded_at > CURRENT_TIMESTAMP - make_interval(hours => %s)
     """, (hours, hours, hours))
 
     result = cursor.fetchone()
@@ -259,28 +436,32 @@ def calculate_throughput(conn, hours: int = 24) -> Dict:
 
     return dict(result) if result else {}
 
-def estimate_remaining_time(conn) -> Dict:
-    """Estimate time to complete remaining downloads."""
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+# Throughput window behind the completion estimate (longer than the last
+# hour for a steadier rate)
+ESTIMATE_WINDOW_HOURS = 6
 
-    # Get pending count
-    cursor.execute("""
-        SELECT COUNT(*) as count
-        FROM index_documents
-        WHERE download_status = 'pending'
-    """)
-    pending = cursor.fetchone()['count']
+def estimate_from_counts(pending: int, completed_recent: int,
+                         hours: int = ESTIMATE_WINDOW_HOURS) -> Dict:
+    """
+    Build the completion estimate from a pending count and recent completions.
 
-    # Get recent throughput (last 6 hours for better estimate)
-    throughput = calculate_throughput(conn, hours=6)
+    Args:
+        pending: Documents still pending
+        completed_recent: Documents completed in the last `hours`
+        hours: Length of the completion window
 
-    if throughput.get('per_hour', 0) > 0:
-        hours_remaining = pending / throughput['per_hour']
+    Returns:
+        Estimate dictionary
+    """
+    per_hour = completed_recent / hours
+
+    if per_hour > 0:
+        hours_remaining = pending / per_hour
         days_remaining = hours_remaining / 24
 
         estimate = {
             'pending_documents': pending,
-            'docs_per_hour': throughput['per_hour'],
+            'docs_per_hour': per_hour,
             'estimated_hours': hours_remaining,
             'estimated_days': days_remaining,
             'estimated_completion': (datetime.now() + timedelta(hours=hours_remaining)).isoformat()
@@ -294,31 +475,50 @@ def estimate_remaining_time(conn) -> Dict:
             'estimated_completion': 'Unknown (no recent activity)'
         }
 
-    cursor.close()
     return estimate
 
-def identify_gaps(conn) -> List[Dict]:
-    """
-    Identify gaps in downloaded documents (missing book/page ranges).
+def estimate_remaining_time(conn) -> Dict:
+    """Estimate time to complete remaining downloads."""
+    cursor = conn.cursor()
+    pending, completed_recent = count_pending_and_recent(cursor, ESTIMATE_WINDOW_HOURS)
+    cursor.close()
 
-    Returns:
-        List of gap ranges
-    """
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    return estimate_from_counts(pending, completed_recent)
 
-    cursor.execute("""
-        WITH book_coverage AS (
-            SELECT DISTINCT book
+# CTEs ending in gaps(gap_start, gap_end, missing_books), the 50 largest runs
+# of books with no completed downloads; used after WITH RECURSIVE. Distinct
+# completed books are walked with a "loose index scan": one seek per book on
+# idx_completed_book instead of reading every completed row for a DISTINCT.
+BOOK_GAPS_CTES = """
+    book_coverage AS (
+        (
+            SELECT book
             FROM index_documents
             WHERE download_status = 'completed'
+              AND book IS NOT NULL
             ORDER BY book
-        ),
-        book_gaps AS (
-            SELECT
-                book as gap_start,
-                LEAD(book) OVER (ORDER BY book) as gap_end
-            FROM book_coverage
+            LIMIT 1
+        )
+        UNION ALL
+        SELECT (
+            SELECT d.book
+            FROM index_documents d
+            WHERE d.download_status = 'completed'
+              AND d.book > c.book
+            ORDER BY d.book
+            LIMIT 1
         )
+        FROM book_coverage c
+        WHERE c.book IS NOT NULL
+    ),
+    book_gaps AS (
+        SELECT
+            book as gap_start,
+            LEAD(book) OVER (ORDER BY book) as gap_end
+        FROM book_coverage
+        WHERE book IS NOT NULL
+    ),
+    gaps AS (
         SELECT
             gap_start,
             gap_end,
@@ -327,17 +527,153 @@ def identify_gaps(conn) -> List[Dict]:
         WHERE gap_end - gap_start > 1
         ORDER BY missing_books DESC
         LIMIT 50
+    )
+"""
+
+def identify_gaps(conn) -> List[Dict]:
+    """
+    Identify gaps in downloaded documents (missing book/page ranges).
+
+    Returns:
+        List of gap ranges
+    """
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+    cursor.execute(f"""
+        WITH RECURSIVE {BOOK_GAPS_CTES}
+        SELECT * FROM gaps
+        ORDER BY missing_books DESC
     """)
 
-    gaps = [dict(row) for row in cursor.fetchall()]
+    gaps = cursor.fetchall()
     cursor.close()
 
     return gaps
 
+# Everything print_progress_report shows, as one jsonb document in a single
+# round-trip. Counts come from the trigger counters and the throughput view;
+# only the error summary and the gap walk touch index_documents.
+# {error_summary} is filled in per run from error_summary_sql.
+PROGRESS_REPORT_SQL = f"""
+    WITH RECURSIVE
+    status AS (
+        SELECT
+            NULLIF(download_status, 'unknown') as download_status,
+            SUM(n) as count,
+            SUM(n) * 100.0 / SUM(SUM(n)) OVER () as percentage
+        FROM index_documents_counters
+        GROUP BY download_status
+        HAVING SUM(n) > 0
+    ),
+    priority AS (
+        SELECT
+            download_priority,
+            NULLIF(download_status, 'unknown') as download_status,
+            SUM(n) as count
+        FROM index_documents_counters
+        WHERE download_priority <> 0
+        GROUP BY 1, 2
+        HAVING SUM(n) > 0
+    ),
+    throughput AS (
+        SELECT
+            COALESCE(SUM(completed), 0) as h24,
+            COALESCE(SUM(completed) FILTER (
+                WHERE bucket > CURRENT_TIMESTAMP - make_interval(hours => %(estimate_hours)s)), 0) as estimate_window,
+            COALESCE(SUM(completed) FILTER (
+                WHERE bucket > CURRENT_TIMESTAMP - INTERVAL '1 hour'), 0) as h1
+        FROM mv_download_throughput
+        WHERE bucket > CURRENT_TIMESTAMP - INTERVAL '24 hours'
+    ),
+    errors AS ({{error_summary}}),
+    {BOOK_GAPS_CTES}
+    SELECT jsonb_build_object(
+        'status_breakdown', (SELECT COALESCE(jsonb_agg(s ORDER BY s.count DESC), '[]') FROM status s),
+        'priority_breakdown', (SELECT COALESCE(jsonb_agg(p ORDER BY p.download_priority, p.download_status), '[]')
+                               FROM priority p),
+        'completed_24h', (SELECT h24 FROM throughput),
+        'completed_1h', (SELECT h1 FROM throughput),
+        'completed_estimate_window', (SELECT estimate_window FROM throughput),
+        'pending', (SELECT COALESCE(SUM(n), 0) FROM index_documents_counters
+                    WHERE download_status = 'pending'),
+        'error_summary', (SELECT COALESCE(jsonb_agg(e ORDER BY e.count DESC), '[]') FROM errors e),
+        'gaps', (SELECT COALESCE(jsonb_agg(g ORDER BY g.missing_books DESC), '[]') FROM gaps g)
+    ) as report
+"""
+
+def throughput_from_count(completed: int, hours: int) -> Dict:
+    """Shape a completion count like calculate_throughput's result."""
+    return {
+        'completed': completed,
+        'per_hour': completed / hours,
+        'per_minute': completed / (hours * 60)
+    }
+
+def get_progress_report(conn) -> Dict:
+    """
+    Gather the progress report data in one query.
+
+    Refreshes the throughput view first if it is stale. Falls back to the
+    individual monitoring queries if the trigger counters or the progress
+    views are not installed.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Dictionary with status_breakdown, priority_breakdown, error_summary,
+        throughput_24h, throughput_1h, estimate, gaps and views_refreshed_at
+        (None when the throughput figures come straight from index_documents)
+    """
+    views_refreshed_at = refresh_stale_views(conn)
+    query = PROGRESS_REPORT_SQL.format(
+        error_summary=error_summary_sql(error_messages_installed(conn), limit=20)
+    )
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(query, {'estimate_hours': ESTIMATE_WINDOW_HOURS})
+    except psycopg2.ProgrammingError:
+        conn.rollback()
+        cursor.close()
+        logger.warning("Counters or progress views not found; running the report query by query")
+        progress = get_download_progress(conn)
+        return {
+            'status_breakdown': progress['status_breakdown'],
+            'priority_breakdown': progress['priority_breakdown'],
+            'error_summary': progress['error_summary'],
+            'throughput_24h': calculate_throughput(conn, hours=24),
+            'throughput_1h': calculate_throughput(conn, hours=1),
+            'estimate': estimate_remaining_time(conn),
+            'gaps': identify_gaps(conn),
+            'views_refreshed_at': views_refreshed_at
+        }
+
+    # psycopg2 decodes jsonb into Python objects
+    report = cursor.fetchone()[0]
+    cursor.close()
+
+    return {
+        'status_breakdown': report['status_breakdown'],
+        'priority_breakdown': report['priority_breakdown'],
+        'error_summary': report['error_summary'],
+        'throughput_24h': throughput_from_count(report['completed_24h'], 24),
+        'throughput_1h': throughput_from_count(report['completed_1h'], 1),
+        'estimate': estimate_from_counts(report['pending'], report['completed_estimate_window']),
+        'gaps': report['gaps'],
+        'views_refreshed_at': views_refreshed_at
+    }
+
 # ============================================================================
 # Reporting Functions
 # ============================================================================
 
+def describe_view_age(refreshed_at: Optional[datetime]) -> str:
+    """Say how current the throughput figures are."""
+    if refreshed_at is None:
+        return "live (progress views not installed)"
+    return f"{refreshed_at.strftime('%Y-%m-%d %H:%M:%S')} (views last refreshed)"
+
 def print_progress_report(conn):
     """Print comprehensive progress report."""
     print("\n" + "="*80)
@@ -347,7 +683,7 @@ def print_progress_report(conn):
     print("="*80)
 
     # Get statistics
-    progress = get_download_progress(conn)
+    progress = get_progress_report(conn)
 
     # Status breakdown
     print("\nSTATUS BREAKDOWN:")
@@ -368,8 +704,9 @@ def print_progress_report(conn):
 
     # Throughput
     print("\nTHROUGHPUT:")
-    throughput_24h = calculate_throughput(conn, hours=24)
-    throughput_1h = calculate_throughput(conn, hours=1)
+    print(f"  As of:          {describe_view_age(progress['views_refreshed_at'])}")
+    throughput_24h = progress['throughput_24h']
+    throughput_1h = progress['throughput_1h']
 
     if throughput_24h:
         print(f"  Last 24 hours:  {throughput_24h['completed']:>8,} docs ({throughput_24h['per_hour']:.1f}/hour)")
@@ -378,7 +715,7 @@ def print_progress_report(conn):
 
     # Time estimate
     print("\nESTIMATED COMPLETION:")
-    estimate = estimate_remaining_time(conn)
+    estimate = progress['estimate']
     print(f"  Pending:        {estimate['pending_documents']:>8,} documents")
     if estimate['estimated_days']:
         print(f"  Est. time:      {estimate['estimated_days']:.1f} days ({estimate['estimated_hours']:.1f} hours)")
@@ -394,7 +731,7 @@ def print_progress_report(conn):
             print(f"  {error:60} {row['count']:>5,}")
 
     # Gaps
-    gaps = identify_gaps(conn)
+    gaps = progress['gaps']
     if gaps:
         print(f"\nGAPS IN COVERAGE ({len(gaps)} gaps found):")
         for gap in gaps[:10]:
@@ -402,14 +739,21 @@ def print_progress_report(conn):
 
     print("\n" + "="*80)
 
+# Window for the health monitor's success rate: documents completed in the
+# window (by downloaded_at) against those completed plus those that failed
+# permanently in it (by updated_at). mv_download_throughput and the
+# index_documents fallback both count this way.
+SUCCESS_RATE_WINDOW_HOURS = 6
+
 def print_health_monitor(conn):
     """Print download health monitor."""
     print("\n" + "="*80)
     print("DOWNLOAD HEALTH MONITOR")
     print("="*80)
 
-    # Check for stale in_progress records
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    # Check for stale in_progress records. Every value here is printed
+    # directly, so a plain tuple cursor is enough.
+    cursor = conn.cursor()
 
     cursor.execute("""
         SELECT COUNT(*) as count
@@ -417,7 +761,7 @@ def print_health_monitor(conn):
         WHERE download_status = 'in_progress'
           AND updated_at < CURRENT_TIMESTAMP - INTERVAL '30 minutes'
     """)
-    stale_count = cursor.fetchone()['count']
+    stale_count = cursor.fetchone()[0]
 
     if stale_count > 0:
         print(f"\n⚠️  WARNING: {stale_count} stale 'in_progress' records (>30 min old)")
@@ -425,27 +769,37 @@ def print_health_monitor(conn):
     else:
         print("\n✓ No stale 'in_progress' records")
 
-    # Check success rate (last 1000 documents)
-    cursor.execute("""
-        SELECT
-            COUNT(*) FILTER (WHERE download_status = 'completed') * 100.0 / COUNT(*) as success_rate
+    # Check success rate over the recent window, summed from the per-minute
+    # completed/failed buckets
+    views_refreshed_at = refresh_stale_views(conn)
+    print(f"Throughput figures as of {describe_view_age(views_refreshed_at)}")
+    window = f"last {SUCCESS_RATE_WINDOW_HOURS} hours"
+    execute_from_views(conn, cursor, """
+        SELECT SUM(completed) * 100.0 / NULLIF(SUM(completed + failed), 0) as success_rate
+        FROM mv_download_throughput
+        WHERE bucket > CURRENT_TIMESTAMP - make_interval(hours => %(hours)s)
+    """, """
+        SELECT completed * 100.0 / NULLIF(completed + failed, 0) as success_rate
         FROM (
-            SELECT download_status
-            FROM index_documents
-            WHERE download_status IN ('completed', 'failed')
-            ORDER BY updated_at DESC
-            LIMIT 1000
-        ) recent
-    """)
-    result = cursor.fetchone()
-    success_rate = result['success_rate'] if result and result['success_rate'] else 0
-
-    if success_rate >= 95:
-        print(f"✓ Success rate: {success_rate:.1f}% (last 1000 docs)")
+            SELECT
+                (SELECT COUNT(*) FROM index_documents
+                 WHERE download_status = 'completed'
+                   AND downloaded_at > CURRENT_TIMESTAMP - make_interval(hours => %(hours)s)) as completed,
+                (SELECT COUNT(*) FROM index_documents
+                 WHERE download_status = 'failed'
+                   AND updated_at > CURRENT_TIMESTAMP - make_interval(hours => %(hours)s)) as failed
+        ) c
+    """, {'hours': SUCCESS_RATE_WINDOW_HOURS})
+    success_rate = cursor.fetchone()[0]
+
+    if success_rate is None:
+        print(f"⚠️  Success rate: no finished downloads ({window})")
+    elif success_rate >= 95:
+        print(f"✓ Success rate: {success_rate:.1f}% ({window})")
     elif success_rate >= 90:
-        print(f"⚠️  Success rate: {success_rate:.1f}% (last 1000 docs) - Below target")
+        print(f"⚠️  Success rate: {success_rate:.1f}% ({window}) - Below target")
     else:
-        print(f"❌ Success rate: {success_rate:.1f}% (last 1000 docs) - CRITICAL")
+        print(f"❌ Success rate: {success_rate:.1f}% ({window}) - CRITICAL")
 
     # Check recent activity
     throughput = calculate_throughput(conn, hours=1)
@@ -455,23 +809,13 @@ def print_health_monitor(conn):
         print("⚠️  No downloads in last hour")
 
     # Check for high error rates
-    cursor.execute("""
-        SELECT
-            download_error,
-            COUNT(*) as count
-        FROM index_documents
-        WHERE download_status = 'failed'
-          AND updated_at > CURRENT_TIMESTAMP - INTERVAL '1 hour'
-        GROUP BY download_error
-        ORDER BY count DESC
-        LIMIT 5
-    """)
+    cursor.execute(error_summary_sql(error_messages_installed(conn), limit=5, window_hours=1))
     recent_errors = cursor.fetchall()
 
     if recent_errors:
         print("\n⚠️  Recent Errors (last hour):")
-        for row in recent_errors:
-            print(f"   {row['download_error'][:60]:60} {row['count']:>3}")
+        for error, count in recent_errors:
+            print(f"   {error[:60]:60} {count:>3}")
 
     cursor.close()
     print("\n" + "="*80)
@@ -492,12 +836,14 @@ def main():
                        help='Generate progress report')
     parser.add_argument('--monitor', action='store_true',
                        help='Monitor download health')
+    parser.add_argument('--refresh-views', action='store_true',
+                       help='Refresh the progress materialized views')
     parser.add_argument('--last-hours', type=int, default=24,
                        help='Time window for validation/monitoring (default: 24)')
 
     args = parser.parse_args()
 
-    if not any([args.validate, args.report, args.monitor]):
+    if not any([args.validate, args.report, args.monitor, args.refresh_views]):
         parser.print_help()
         return 1
 
@@ -510,6 +856,10 @@ def main():
         return 1
 
     try:
+        if args.refresh_views:
+            refresh_progress_views(conn)
+            logger.info("✓ Refreshed progress views")
+
         if args.validate:
             # TODO: Implement validation logic
             print("Validation not yet implemented")
@@ -83,34 +83,36 @@ class GCSManager:
         if not local_path.exists():
             raise FileNotFoundError(f"Local file not found: {local_path}")
         
-        # Calculate checksum
-        checksum = self._calculate_checksum(local_path)
-        
-        # Check if file already exists with same checksum
-        blob = self.bucket.blob(gcs_path)
-        if blob.exists():
-            blob.reload()
-            existing_checksum = blob.metadata.get('checksum') if blob.metadata else None
-            if existing_checksum == checksum:
-                logger.info(f"File already exists with same checksum: {gcs_path}")
-                return (f"gs://{self.bucket_name}/{gcs_path}", checksum)
-        
-        # Prepare metadata
-        if metadata is None:
-            metadata = {}
-        metadata.update({
-            'checksum': checksum,
-            'upload_time': datetime.now().isoformat(),
-            'original_filename': local_path.name
-        })
-        
-        # Upload file
-        blob = self.bucket.blob(gcs_path)
-        blob.metadata = metadata
-        
-        logger.info(f"Uploading {local_path.name} to {gcs_path}")
-        
+        # One handle serves both the checksum pass and the upload
         with open(local_path, 'rb') as f:
+            # Calculate checksum
+            checksum = self._checksum_stream(f)
+            
+            # Check if file already exists with same checksum
+            blob = self.bucket.blob(gcs_path)
+            if blob.exists():
+                blob.reload()
+                existing_checksum = blob.metadata.get('checksum') if blob.metadata else None
+                if existing_checksum == checksum:
+                    logger.debug(f"File already exists with same checksum: {gcs_path}")
+                    return (f"gs://{self.bucket_name}/{gcs_path}", checksum)
+            
+            # Prepare metadata
+            if metadata is None:
+                metadata = {}
+            metadata.update({
+                'checksum': checksum,
+                'upload_time': datetime.now().isoformat(),
+                'original_filename': local_path.name
+            })
+            
+            # Upload file
+            blob = self.bucket.blob(gcs_path)
+            blob.metadata = metadata
+            
+            logger.debug(f"Uploading {local_path.name} to {gcs_path}")
+            
+            f.seek(0)
             blob.upload_from_file(f, content_type=content_type)
         
         # Verify upload
@@ -118,7 +120,7 @@ class GCSManager:
             raise Exception(f"Upload verification failed for {gcs_path}")
         
         gcs_url = f"gs://{self.bucket_name}/{gcs_path}"
-        logger.info(f"Successfully uploaded to {gcs_url}")
+        logger.debug(f"Successfully uploaded to {gcs_url}")
         
         return (gcs_url, checksum)
     
@@ -229,12 +231,15 @@ class GCSManager:
         Returns:
             Hex string of checksum
         """
-        sha256_hash = hashlib.sha256()
-        
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256_hash.update(chunk)
-        
+            return self._checksum_stream(f)
+    
+    @staticmethod
+    def _checksum_stream(f) -> str:
+        """SHA256 of an open binary file, read in 1 MiB blocks."""
+        sha256_hash = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha256_hash.update(chunk)
         return sha256_hash.hexdigest()
     
     def create_folder_structure(self):
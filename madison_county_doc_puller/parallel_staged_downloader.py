@@ -28,7 +28,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from queue import Queue
 
 # Add parent directory to path
@@ -41,7 +42,7 @@ from psycopg2.pool import ThreadedConnectionPool
 from madison_county_doc_puller.simple_doc_downloader import MadisonCountyDownloader
 from madison_county_doc_puller.download_queue_manager import (
     DownloadQueueManager,
-    determine_portal,
+    WORKER_CONNECTION_OPTIONS,
     STAGE_CONFIGS
 )
 from madison_county_doc_puller.pdf_optimizer import PDFOptimizer
@@ -64,7 +65,7 @@ DEFAULT_WORKERS = 5  # Number of concurrent download threads
 RATE_LIMIT_DELAY = 0.5  # Delay between requests (seconds) per thread
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if os.getenv('MC_DEBUG') == '1' else logging.INFO,
     format='%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s',
     handlers=[
         logging.FileHandler(LOG_FILE),
@@ -86,7 +87,8 @@ def create_connection_pool(min_conn: int = 2, max_conn: int = 20):
         port=os.getenv('DB_PORT', 5432),
         database=os.getenv('DB_NAME', 'madison_county_index'),
         user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD')
+        password=os.getenv('DB_PASSWORD'),
+        **WORKER_CONNECTION_OPTIONS
     )
 
 # ============================================================================
@@ -105,16 +107,19 @@ class RateLimiter:
         """
         self.delay = delay
         self.lock = threading.Lock()
-        self.last_request = 0
+        self.next_slot = 0.0
 
     def wait(self):
         """Wait if necessary to respect rate limit."""
+        # Reserve the next free slot under the lock, then sleep outside it so
+        # waiting threads queue up on distinct slots instead of on the lock
         with self.lock:
-            now = time.time()
-            elapsed = now - self.last_request
-            if elapsed < self.delay:
-                time.sleep(self.delay - elapsed)
-            self.last_request = time.time()
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.delay
+
+        if slot > now:
+            time.sleep(slot - now)
 
 # ============================================================================
 # Thread-Safe Statistics
@@ -124,7 +129,9 @@ class ThreadSafeStatistics:
     """Thread-safe download statistics tracker."""
 
     def __init__(self):
-        self.lock = threading.Lock()
+        # Reentrant: to_dict() calls get_success_rate()/get_docs_per_hour()
+        # while already holding it
+        self.lock = threading.RLock()
         self.start_time = datetime.now()
         self.total_attempted = 0
         self.total_completed = 0
@@ -248,6 +255,11 @@ class ThreadSafeStatistics:
 class DownloadWorker:
     """Worker class for processing documents in parallel."""
 
+    # Status updates are buffered and written in batches of this many, or
+    # once this many seconds have passed since the last write
+    FLUSH_BATCH_SIZE = 25
+    FLUSH_INTERVAL = 5.0
+
     def __init__(self, worker_id: int, conn_pool: ThreadedConnectionPool,
                  stage: str, rate_limiter: RateLimiter,
                  gcs_manager: GCSManager, pdf_optimizer: Optional[PDFOptimizer],
@@ -277,6 +289,13 @@ class DownloadWorker:
             download_dir=Path(__file__).parent / 'temp_downloads' / f'worker_{worker_id}'
         )
         self.conn = None
+        self.queue = None
+
+        # Buffered status updates; documents stay 'in_progress' until flushed,
+        # so anything lost in a crash is picked up by reset_in_progress_records
+        self.pending_completions: List[Dict] = []
+        self.pending_failures: List[Tuple[int, str, bool]] = []
+        self.last_flush = time.monotonic()
 
     def get_connection(self):
         """Get database connection from pool."""
@@ -284,11 +303,74 @@ class DownloadWorker:
             self.conn = self.conn_pool.getconn()
         return self.conn
 
+    def get_queue(self) -> DownloadQueueManager:
+        """Get this worker's queue manager, created once per connection."""
+        if self.queue is None:
+            self.queue = DownloadQueueManager(self.get_connection(), self.stage)
+        return self.queue
+
+    def discard_connection(self):
+        """Close a broken database connection instead of returning it to the pool for reuse."""
+        if self.conn:
+            try:
+                if self.queue is not None:
+                    self.queue.close()
+            except psycopg2.Error:
+                pass
+            self.conn_pool.putconn(self.conn, close=True)
+            self.conn = None
+            self.queue = None
+
+    def flush_updates(self):
+        """
+        Write buffered completions and failures, one batch each.
+
+        If the connection breaks mid-flush it is closed and the flush retried
+        once on a fresh one. Batches that still fail are kept for the next flush.
+        """
+        for _ in range(2):
+            if not (self.pending_completions or self.pending_failures):
+                break
+            try:
+                queue = self.get_queue()
+                if self.pending_completions and queue.mark_completed_many(self.pending_completions):
+                    self.pending_completions = []
+                if self.pending_failures and queue.mark_failed_many(self.pending_failures):
+                    self.pending_failures = []
+                break
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                logger.warning(f"[Worker {self.worker_id}] Database connection lost during flush, reconnecting: {e}")
+                self.discard_connection()
+
+        self.last_flush = time.monotonic()
+
+    def flush_if_due(self):
+        """Flush buffered updates once the batch is full or FLUSH_INTERVAL has passed."""
+        buffered = len(self.pending_completions) + len(self.pending_failures)
+        if (buffered >= self.FLUSH_BATCH_SIZE
+                or (buffered and time.monotonic() - self.last_flush >= self.FLUSH_INTERVAL)):
+            self.flush_updates()
+
     def return_connection(self):
-        """Return database connection to pool."""
+        """Flush buffered updates and return database connection to pool."""
+        try:
+            self.flush_updates()
+        except Exception as e:
+            logger.error(f"[Worker {self.worker_id}] Failed to flush "
+                         f"{len(self.pending_completions)} completion(s) and "
+                         f"{len(self.pending_failures)} failure(s): {e}")
+
         if self.conn:
+            if self.queue is not None:
+                self.queue.close()
             self.conn_pool.putconn(self.conn)
             self.conn = None
+            self.queue = None
+
+    def close(self):
+        """Return the database connection and release pooled HTTP sockets."""
+        self.return_connection()
+        self.downloader.close()
 
     def process_document(self, doc: Dict) -> Tuple[bool, Optional[str], Optional[Dict]]:
         """
@@ -301,25 +383,15 @@ class DownloadWorker:
             Tuple of (success, error_message, validation_data)
         """
         doc_id = doc['id']
-        portal = determine_portal(doc['book'])
+        portal = doc['portal']
         book = doc['book']
         page = doc['page']
         instrument_number = doc.get('instrument_number')
 
         try:
-            # Get database connection
-            conn = self.get_connection()
-            queue = DownloadQueueManager(conn, self.stage)
-
-            # Mark as in progress
-            queue.mark_in_progress(doc_id)
-
-            # Rate limit before download
-            self.rate_limiter.wait()
-
+            # Already marked in_progress when fetch_next_batch claimed it
             if self.dry_run:
                 logger.info(f"[Worker {self.worker_id}] [DRY RUN] Would download: Instrument {instrument_number}, Book {book}, Page {page}")
-                time.sleep(0.1)
                 validation_data = {
                     'actual_book': book,
                     'actual_page': page,
@@ -329,6 +401,9 @@ class DownloadWorker:
                 original_size = 30000
                 optimized_size = 15000
             else:
+                # Rate limit before download
+                self.rate_limiter.wait()
+
                 # Download with validation
                 if instrument_number:
                     result = self.downloader.download_by_instrument(
@@ -362,14 +437,14 @@ class DownloadWorker:
                 if Path(result.local_path).exists():
                     Path(result.local_path).unlink()
 
-            # Mark as completed
-            queue.mark_completed(
-                doc_id=doc_id,
-                gcs_path=gcs_url,
-                actual_book=validation_data.get('actual_book'),
-                actual_page=validation_data.get('actual_page'),
-                book_page_mismatch=validation_data.get('book_page_mismatch', False)
-            )
+            # Mark as completed (written with the next batch)
+            self.pending_completions.append({
+                'doc_id': doc_id,
+                'gcs_path': gcs_url,
+                'actual_book': validation_data.get('actual_book'),
+                'actual_page': validation_data.get('actual_page'),
+                'book_page_mismatch': validation_data.get('book_page_mismatch', False)
+            })
 
             return (True, None, {
                 'validation_data': validation_data,
@@ -380,12 +455,7 @@ class DownloadWorker:
 
         except Exception as e:
             error_msg = str(e)[:500]
-            try:
-                conn = self.get_connection()
-                queue = DownloadQueueManager(conn, self.stage)
-                queue.mark_failed(doc_id, error_msg, retry=True)
-            except Exception as db_error:
-                logger.error(f"[Worker {self.worker_id}] Failed to mark doc {doc_id} as failed: {db_error}")
+            self.pending_failures.append((doc_id, error_msg, True))
 
             return (False, error_msg, {'portal': portal})
 
@@ -408,7 +478,7 @@ class DownloadWorker:
         if self.pdf_optimizer:
             try:
                 original_size, optimized_size = self.pdf_optimizer.optimize_in_place(local_file)
-                logger.info(f"[Worker {self.worker_id}] Optimized: {original_size:,} → {optimized_size:,} bytes")
+                logger.debug(f"[Worker {self.worker_id}] Optimized: {original_size:,} → {optimized_size:,} bytes")
             except Exception as e:
                 logger.warning(f"[Worker {self.worker_id}] PDF optimization failed: {e}")
 
@@ -478,6 +548,11 @@ class ParallelDownloadManager:
         self.rate_limiter = RateLimiter(delay=RATE_LIMIT_DELAY)
         self.stats = ThreadSafeStatistics()
 
+        # Workers are bound to pool threads (see _process_document)
+        self.workers: List[DownloadWorker] = []
+        self._workers_lock = threading.Lock()
+        self._thread_local = threading.local()
+
         # Initialize GCS and PDF optimizer
         self.gcs_manager = None
         self.pdf_optimizer = None
@@ -502,6 +577,36 @@ class ParallelDownloadManager:
         if dry_run:
             logger.info("DRY RUN MODE - No actual downloads")
 
+    def _process_document(self, doc: Dict) -> Tuple[bool, Optional[str], Optional[Dict]]:
+        """
+        Process a document on the calling thread's own worker.
+
+        Each pool thread lazily creates one DownloadWorker and keeps it, so a
+        worker's requests session and database connection are never used by
+        two threads at once.
+        """
+        worker = getattr(self._thread_local, 'worker', None)
+        if worker is None:
+            with self._workers_lock:
+                worker = DownloadWorker(
+                    worker_id=len(self.workers),
+                    conn_pool=self.conn_pool,
+                    stage=self.stage,
+                    rate_limiter=self.rate_limiter,
+                    gcs_manager=self.gcs_manager,
+                    pdf_optimizer=self.pdf_optimizer,
+                    dry_run=self.dry_run
+                )
+                self.workers.append(worker)
+            self._thread_local.worker = worker
+
+        result = worker.process_document(doc)
+        try:
+            worker.flush_if_due()
+        except Exception as e:
+            logger.error(f"[Worker {worker.worker_id}] Failed to flush status updates: {e}")
+        return result
+
     def run(self):
         """Execute parallel download process."""
         print("\n" + "="*80)
@@ -536,70 +641,78 @@ class ParallelDownloadManager:
                 print("Download cancelled.")
                 return
 
-        # Create workers
-        workers = [
-            DownloadWorker(
-                worker_id=i,
-                conn_pool=self.conn_pool,
-                stage=self.stage,
-                rate_limiter=self.rate_limiter,
-                gcs_manager=self.gcs_manager,
-                pdf_optimizer=self.pdf_optimizer,
-                dry_run=self.dry_run
-            )
-            for i in range(self.num_workers)
-        ]
-
-        # Process documents with ThreadPoolExecutor
+        # Process documents with ThreadPoolExecutor. The pool is topped up as
+        # each document finishes rather than batch by batch, so threads never
+        # sit idle waiting for the slowest document of a batch.
+        stage_limit = STAGE_CONFIGS[self.stage]['limit']
+        max_in_flight = self.num_workers * 2
         document_count = 0
-        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-            with tqdm(total=pending_count, desc="Downloading") as pbar:
-                while True:
-                    # Fetch next batch
-                    batch = self.queue.fetch_next_batch(limit=self.num_workers * 10)
-
-                    if not batch:
-                        logger.info("No more documents in queue")
-                        break
-
-                    # Submit batch to workers
-                    futures = {}
-                    for doc in batch:
-                        worker = workers[document_count % self.num_workers]
-                        future = executor.submit(worker.process_document, doc)
-                        futures[future] = doc
-
-                    # Process completed futures
-                    for future in as_completed(futures):
-                        doc = futures[future]
-                        success, error, result_data = future.result()
-
-                        if success:
-                            self.stats.record_success(
-                                portal=result_data['portal'],
-                                book_page_mismatch=result_data['validation_data'].get('book_page_mismatch', False),
-                                original_size=result_data.get('original_size', 0),
-                                optimized_size=result_data.get('optimized_size', 0)
-                            )
-                        else:
-                            self.stats.record_failure(error, result_data['portal'])
-
-                        document_count += 1
-                        pbar.update(1)
-
-                        # Check stage limit
-                        if STAGE_CONFIGS[self.stage]['limit']:
-                            if document_count >= STAGE_CONFIGS[self.stage]['limit']:
-                                logger.info(f"Stage limit reached: {document_count}")
-                                executor.shutdown(wait=True)
-                                break
+        submitted = 0
+        backlog = deque()
+        queue_exhausted = False
+        in_flight = {}  # future -> document id
 
-        # Cleanup workers
-        for worker in workers:
-            worker.return_connection()
+        try:
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                try:
+                    with tqdm(total=pending_count, desc="Downloading") as pbar:
+                        while True:
+                            while (not queue_exhausted and len(in_flight) < max_in_flight
+                                   and not (stage_limit and submitted >= stage_limit)):
+                                if not backlog:
+                                    backlog.extend(self.queue.fetch_next_batch(limit=self.num_workers * 10))
+                                    if not backlog:
+                                        logger.info("No more documents in queue")
+                                        queue_exhausted = True
+                                        break
+                                doc = backlog.popleft()
+                                in_flight[executor.submit(self._process_document, doc)] = doc['id']
+                                submitted += 1
+
+                            if not in_flight:
+                                break
 
-        # Return main connection
-        self.conn_pool.putconn(self.main_conn)
+                            # Process completed futures
+                            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                del in_flight[future]
+                                success, error, result_data = future.result()
+
+                                if success:
+                                    self.stats.record_success(
+                                        portal=result_data['portal'],
+                                        book_page_mismatch=result_data['validation_data'].get('book_page_mismatch', False),
+                                        original_size=result_data.get('original_size', 0),
+                                        optimized_size=result_data.get('optimized_size', 0)
+                                    )
+                                else:
+                                    self.stats.record_failure(error, result_data['portal'])
+
+                                document_count += 1
+                                pbar.update(1)
+                finally:
+                    # On Ctrl-C, let running documents finish but drop queued ones
+                    executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            # Cleanup workers (flushes their buffered status updates)
+            for worker in self.workers:
+                worker.close()
+
+            # Hand back documents claimed but never processed: the unsubmitted
+            # backlog plus any submitted documents that were cancelled or did
+            # not get recorded. Rows already marked are no longer in_progress
+            # and are left alone.
+            unprocessed = [doc['id'] for doc in backlog] + list(in_flight.values())
+            if unprocessed:
+                self.main_conn.rollback()
+                self.queue.release_batch(unprocessed)
+
+            # Return main connection
+            self.queue.close()
+            self.conn_pool.putconn(self.main_conn)
+
+        if stage_limit and document_count >= stage_limit:
+            logger.info(f"Stage limit reached: {document_count}")
 
         # Print final statistics
         self.stats.print_summary()
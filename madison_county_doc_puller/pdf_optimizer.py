@@ -89,7 +89,7 @@ class PDFOptimizer:
             str(input_path)
         ]
 
-        logger.info(f"Optimizing {input_path.name} with quality={self.quality}")
+        logger.debug(f"Optimizing {input_path.name} with quality={self.quality}")
 
         try:
             result = subprocess.run(
@@ -107,7 +107,7 @@ class PDFOptimizer:
             savings = original_size - optimized_size
             savings_pct = (savings / original_size * 100) if original_size > 0 else 0
 
-            logger.info(
+            logger.debug(
                 f"Optimized {input_path.name}: "
                 f"{original_size:,} → {optimized_size:,} bytes "
                 f"({savings_pct:.1f}% reduction)"
@@ -143,9 +143,9 @@ class PDFOptimizer:
                 temp_output
             )
 
-            # Replace original with optimized
-            file_path.unlink()
-            temp_output.rename(file_path)
+            # Replace original with optimized (single atomic rename; the temp
+            # file is always in the same directory)
+            temp_output.replace(file_path)
 
             return (original_size, optimized_size)
 
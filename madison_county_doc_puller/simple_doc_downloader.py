@@ -28,10 +28,50 @@ from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# Response Patterns (compiled once, used for every lookup response)
+# ============================================================================
+
+# C-backed parser; html.parser is pure Python and several times slower
+HTML_PARSER = 'lxml'
+
+GRANTOR_RE = re.compile(r'Grantor:\s*(.+?)(?:Grantee:|$)', re.DOTALL)
+GRANTEE_RE = re.compile(r'Grantee:\s*(.+?)$', re.DOTALL)
+NATURE_RE = re.compile(r'Nature:\s*<em>(.+?)</em>')
+SUBDIVISION_RE = re.compile(r'SubDivision Code:\s*<em>(.+?)</em>')
+LOT_RE = re.compile(r'Lot:\s*<em>(.+?)</em>')
+
+TYPE_CELL_RE = re.compile(r'Type:\s*(.+)')
+BOOK_CELL_RE = re.compile(r'Book:\s*(\d+)')
+PAGE_CELL_RE = re.compile(r'Page:\s*(\d+)')
+SECTION_CELL_RE = re.compile(r'Section:\s*(.+)')
+TOWNSHIP_CELL_RE = re.compile(r'Township:\s*(.+)')
+RANGE_CELL_RE = re.compile(r'Range:\s*(.+)')
+DATE_CELL_RE = re.compile(r'Date\s+Recorded:\s*(.+)')
+
+# Parsing needs the grantor/grantee <h2>; pages without one (no results) fail fast
+RESULT_HEADER_RE = re.compile(r'<h2[\s>]', re.IGNORECASE)
+IMAGE_LINK_RE = re.compile(r'pdf-records\.php\?image=')
+IMAGE_ID_RE = re.compile(r'image=(\d+)')
+
+# Table cell label (text before the first colon) -> (field, pattern, converter)
+CELL_FIELDS = {
+    'Type': ('doc_type', TYPE_CELL_RE, str.strip),
+    'Book': ('book', BOOK_CELL_RE, int),
+    'Page': ('page', PAGE_CELL_RE, int),
+    'Section': ('section', SECTION_CELL_RE, str.strip),
+    'Township': ('township', TOWNSHIP_CELL_RE, str.strip),
+    'Range': ('range', RANGE_CELL_RE, str.strip),
+}
+# Date cells are matched by prefix ("Date Recorded:", spacing varies)
+DATE_CELL_FIELD = ('date_recorded', DATE_CELL_RE, str.strip)
+
 # ============================================================================
 # Data Classes
 # ============================================================================
@@ -81,6 +121,12 @@ class MadisonCountyDownloader:
     BASE_URL = "https://tools.madison-co.net"
     LOOKUP_URL = f"{BASE_URL}/elected-offices/chancery-clerk/court-house-search/drupal-deed-record-lookup.php"
     PDF_URL = f"{BASE_URL}/elected-offices/chancery-clerk/court-house-search/pdf-records.php"
+    CHUNK_SIZE = 64 * 1024  # Bytes per read when streaming PDFs to disk
+
+    # Timeouts (seconds): a dead server should fail fast on connect, lookup
+    # pages are small, and only PDF bodies get the full read timeout
+    CONNECT_TIMEOUT = 5
+    LOOKUP_TIMEOUT = 15
 
     def __init__(self, download_dir: str = "./downloads", timeout: int = 30):
         """
@@ -88,16 +134,33 @@ class MadisonCountyDownloader:
 
         Args:
             download_dir: Directory to save downloaded PDFs
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds for PDF downloads (lookups use
+                the shorter of this and LOOKUP_TIMEOUT)
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(exist_ok=True, parents=True)
         self.timeout = timeout
+        self.lookup_timeout = (self.CONNECT_TIMEOUT, min(self.LOOKUP_TIMEOUT, timeout))
+        self.pdf_timeout = (self.CONNECT_TIMEOUT, timeout)
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/pdf,*/*'
         })
 
+        # Keep-alive pool for the county server, retrying transient failures
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def download_by_instrument(
         self,
         instrument_number: int,
@@ -115,7 +178,7 @@ class MadisonCountyDownloader:
         Returns:
             DownloadResult with download status and metadata
         """
-        logger.info(f"Downloading instrument {instrument_number}")
+        logger.debug(f"Downloading instrument {instrument_number}")
 
         try:
             # Step 1: Query by instrument number
@@ -150,6 +213,19 @@ class MadisonCountyDownloader:
             local_path = None
             if metadata.image_id:
                 local_path = self._download_pdf(metadata)
+                if local_path is None:
+                    return DownloadResult(
+                        success=False,
+                        instrument_number=instrument_number,
+                        expected_book=expected_book,
+                        expected_page=expected_page,
+                        actual_book=metadata.book,
+                        actual_page=metadata.page,
+                        book_page_mismatch=book_page_mismatch,
+                        local_path=None,
+                        error="Response not a PDF",
+                        metadata=metadata
+                    )
             else:
                 return DownloadResult(
                     success=False,
@@ -236,7 +312,7 @@ class MadisonCountyDownloader:
         Returns:
             DownloadResult with download status
         """
-        logger.info(f"Downloading book {book}, page {page}")
+        logger.debug(f"Downloading book {book}, page {page}")
 
         params = {
             "grantor": "",
@@ -252,67 +328,86 @@ class MadisonCountyDownloader:
         }
 
         try:
-            response = self.session.get(
+            with self.session.get(
                 self.LOOKUP_URL,
                 params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            # Check if it's a direct PDF response
-            content_type = response.headers.get('Content-Type', '').lower()
-
-            if 'pdf' in content_type or response.content.startswith(b'%PDF-'):
-                # Direct PDF download
-                filename = f"{book:04d}-{page:04d}.pdf"
-                file_path = self.download_dir / filename
-
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
-
-                return DownloadResult(
-                    success=True,
-                    instrument_number=None,
-                    expected_book=book,
-                    expected_page=page,
-                    actual_book=book,
-                    actual_page=page,
-                    book_page_mismatch=False,
-                    local_path=str(file_path),
-                    error=None,
-                    metadata=None
-                )
-            else:
-                # HTML response - need to parse and extract PDF link
-                metadata = self._parse_html_response(response.text)
+                timeout=self.lookup_timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+
+                # Check if it's a direct PDF response
+                content_type = response.headers.get('Content-Type', '').lower()
+                chunks = response.iter_content(chunk_size=self.CHUNK_SIZE)
+                first_chunk = next(chunks, b'')
+
+                if 'pdf' in content_type or first_chunk.startswith(b'%PDF-'):
+                    # Direct PDF download, streamed to disk
+                    filename = f"{book:04d}-{page:04d}.pdf"
+                    file_path = self.download_dir / filename
+                    self._write_chunks(file_path, first_chunk, chunks)
 
-                if metadata and metadata.image_id:
-                    local_path = self._download_pdf(metadata)
                     return DownloadResult(
                         success=True,
-                        instrument_number=metadata.instrument_number,
+                        instrument_number=None,
                         expected_book=book,
                         expected_page=page,
-                        actual_book=metadata.book,
-                        actual_page=metadata.page,
-                        book_page_mismatch=(metadata.book != book or metadata.page != page),
-                        local_path=str(local_path),
+                        actual_book=book,
+                        actual_page=page,
+                        book_page_mismatch=False,
+                        local_path=str(file_path),
                         error=None,
-                        metadata=metadata
+                        metadata=None
                     )
-                else:
+
+                # HTML response (small) - buffer it for parsing
+                html = (first_chunk + b''.join(chunks)).decode(
+                    response.encoding or 'utf-8', errors='replace'
+                )
+
+            # Parse and extract PDF link
+            metadata = self._parse_html_response(html)
+
+            if metadata and metadata.image_id:
+                local_path = self._download_pdf(metadata)
+                if local_path is None:
                     return DownloadResult(
                         success=False,
-                        instrument_number=None,
+                        instrument_number=metadata.instrument_number,
                         expected_book=book,
                         expected_page=page,
-                        actual_book=None,
-                        actual_page=None,
-                        book_page_mismatch=False,
+                        actual_book=metadata.book,
+                        actual_page=metadata.page,
+                        book_page_mismatch=(metadata.book != book or metadata.page != page),
                         local_path=None,
-                        error="No PDF found in HTML response",
+                        error="Response not a PDF",
                         metadata=metadata
                     )
+                return DownloadResult(
+                    success=True,
+                    instrument_number=metadata.instrument_number,
+                    expected_book=book,
+                    expected_page=page,
+                    actual_book=metadata.book,
+                    actual_page=metadata.page,
+                    book_page_mismatch=(metadata.book != book or metadata.page != page),
+                    local_path=str(local_path),
+                    error=None,
+                    metadata=metadata
+                )
+            else:
+                return DownloadResult(
+                    success=False,
+                    instrument_number=None,
+                    expected_book=book,
+                    expected_page=page,
+                    actual_book=None,
+                    actual_page=None,
+                    book_page_mismatch=False,
+                    local_path=None,
+                    error="No PDF found in HTML response",
+                    metadata=metadata
+                )
 
         except Exception as e:
             return DownloadResult(
@@ -355,7 +450,7 @@ class MadisonCountyDownloader:
         response = self.session.get(
             self.LOOKUP_URL,
             params=params,
-            timeout=self.timeout
+            timeout=self.lookup_timeout
         )
         response.raise_for_status()
 
@@ -376,7 +471,11 @@ class MadisonCountyDownloader:
         Returns:
             DocumentMetadata if parsed successfully, None otherwise
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        # Cheap scan first so empty results never pay for a full parse
+        if not RESULT_HEADER_RE.search(html):
+            return None
+
+        soup = BeautifulSoup(html, HTML_PARSER)
 
         try:
             # Extract grantor/grantee from h2 tag
@@ -387,19 +486,19 @@ class MadisonCountyDownloader:
             h2_text = h2.get_text()
 
             # Parse: "Grantor: <em>NAME<br />Grantee: <em>NAME"
-            grantor_match = re.search(r'Grantor:\s*(.+?)(?:Grantee:|$)', h2_text, re.DOTALL)
-            grantee_match = re.search(r'Grantee:\s*(.+?)$', h2_text, re.DOTALL)
+            grantor_match = GRANTOR_RE.search(h2_text)
+            grantee_match = GRANTEE_RE.search(h2_text)
 
             grantor = grantor_match.group(1).strip() if grantor_match else ""
             grantee = grantee_match.group(1).strip() if grantee_match else ""
 
             # Extract nature (document type)
-            nature_match = re.search(r'Nature:\s*<em>(.+?)</em>', html)
+            nature_match = NATURE_RE.search(html)
             doc_nature = nature_match.group(1).strip() if nature_match else ""
 
             # Extract subdivision code and lot
-            subdivision_match = re.search(r'SubDivision Code:\s*<em>(.+?)</em>', html)
-            lot_match = re.search(r'Lot:\s*<em>(.+?)</em>', html)
+            subdivision_match = SUBDIVISION_RE.search(html)
+            lot_match = LOT_RE.search(html)
 
             subdivision_code = subdivision_match.group(1).strip() if subdivision_match else None
             lot = lot_match.group(1).strip() if lot_match else None
@@ -414,44 +513,32 @@ class MadisonCountyDownloader:
             cell_texts = [cell.get_text().strip() for cell in cells]
 
             # Extract values
-            doc_type = None
-            book = None
-            page = None
-            section = None
-            township = None
-            range_val = None
-            date_recorded = None
-
+            values = {}
             for cell in cell_texts:
-                if cell.startswith('Type:'):
-                    doc_type = re.search(r'Type:\s*(.+)', cell)
-                    doc_type = doc_type.group(1).strip() if doc_type else None
-                elif cell.startswith('Book:'):
-                    book_match = re.search(r'Book:\s*(\d+)', cell)
-                    book = int(book_match.group(1)) if book_match else None
-                elif cell.startswith('Page:'):
-                    page_match = re.search(r'Page:\s*(\d+)', cell)
-                    page = int(page_match.group(1)) if page_match else None
-                elif cell.startswith('Section:'):
-                    section_match = re.search(r'Section:\s*(.+)', cell)
-                    section = section_match.group(1).strip() if section_match else None
-                elif cell.startswith('Township:'):
-                    township_match = re.search(r'Township:\s*(.+)', cell)
-                    township = township_match.group(1).strip() if township_match else None
-                elif cell.startswith('Range:'):
-                    range_match = re.search(r'Range:\s*(.+)', cell)
-                    range_val = range_match.group(1).strip() if range_match else None
-                elif cell.startswith('Date'):
-                    date_match = re.search(r'Date\s+Recorded:\s*(.+)', cell)
-                    date_recorded = date_match.group(1).strip() if date_match else None
+                spec = CELL_FIELDS.get(cell.partition(':')[0])
+                if spec is None:
+                    if not cell.startswith('Date'):
+                        continue
+                    spec = DATE_CELL_FIELD
+                field, pattern, convert = spec
+                match = pattern.search(cell)
+                values[field] = convert(match.group(1)) if match else None
+
+            doc_type = values.get('doc_type')
+            book = values.get('book')
+            page = values.get('page')
+            section = values.get('section')
+            township = values.get('township')
+            range_val = values.get('range')
+            date_recorded = values.get('date_recorded')
 
             # Extract PDF image_id from download link
-            image_link = soup.find('a', href=re.compile(r'pdf-records\.php\?image='))
+            image_link = soup.find('a', href=IMAGE_LINK_RE)
             image_id = None
 
             if image_link:
                 href = image_link.get('href', '')
-                image_match = re.search(r'image=(\d+)', href)
+                image_match = IMAGE_ID_RE.search(href)
                 image_id = image_match.group(1) if image_match else None
 
             if book and page:
@@ -493,25 +580,51 @@ class MadisonCountyDownloader:
 
         url = f"{self.PDF_URL}?image={metadata.image_id}"
 
-        response = self.session.get(url, timeout=self.timeout)
-        response.raise_for_status()
-
-        # Verify it's a PDF
-        if not (response.headers.get('Content-Type', '').lower().startswith('application/pdf')
-                or response.content.startswith(b'%PDF-')):
-            logger.error(f"Response is not a PDF for image_id {metadata.image_id}")
-            return None
-
         # Use actual book/page from metadata (validated)
         filename = f"{metadata.book:04d}-{metadata.page:04d}.pdf"
         file_path = self.download_dir / filename
 
-        with open(file_path, 'wb') as f:
-            f.write(response.content)
+        # Stream to disk so memory stays flat regardless of scan size
+        with self.session.get(url, timeout=self.pdf_timeout, stream=True) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=self.CHUNK_SIZE)
+            first_chunk = next(chunks, b'')
+
+            # Verify it's a PDF before writing anything
+            if not (response.headers.get('Content-Type', '').lower().startswith('application/pdf')
+                    or first_chunk.startswith(b'%PDF-')):
+                logger.error(f"Response is not a PDF for image_id {metadata.image_id}")
+                return None
 
-        logger.info(f"Downloaded PDF to {file_path}")
+            self._write_chunks(file_path, first_chunk, chunks)
+
+        logger.debug(f"Downloaded PDF to {file_path}")
         return file_path
 
+    def _write_chunks(self, file_path: Path, first_chunk: bytes, chunks) -> None:
+        """
+        Write an already-sniffed response stream to disk.
+
+        The stream goes to a .part file that is renamed into place once
+        complete, so an interrupted download never leaves a truncated PDF
+        under the final name.
+
+        Args:
+            file_path: Destination file
+            first_chunk: Chunk consumed while checking for the PDF header
+            chunks: Iterator over the remaining response chunks
+        """
+        part_path = file_path.with_name(file_path.name + '.part')
+        try:
+            with open(part_path, 'wb') as f:
+                f.write(first_chunk)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(part_path, file_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
     def close(self):
         """Close the requests session."""
         self.session.close()
@@ -33,13 +33,11 @@ from tqdm import tqdm
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import psycopg2
-
 # Import existing components
 from madison_county_doc_puller.simple_doc_downloader import MadisonCountyDownloader
 from madison_county_doc_puller.download_queue_manager import (
     DownloadQueueManager,
-    determine_portal,
+    connect_index_db,
     STAGE_CONFIGS
 )
 from madison_county_doc_puller.pdf_optimizer import PDFOptimizer
@@ -57,8 +55,11 @@ CHECKPOINT_DIR.mkdir(exist_ok=True)
 GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'madison-county-title-plant')
 GCS_CREDENTIALS_PATH = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
 
+# Minimum spacing between the start of consecutive document downloads (seconds)
+REQUEST_INTERVAL = 2.0
+
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if os.getenv('MC_DEBUG') == '1' else logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler(LOG_FILE),
@@ -72,14 +73,8 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 def connect_db():
-    """Connect to the index database."""
-    return psycopg2.connect(
-        host=os.getenv('DB_HOST', '127.0.0.1'),
-        port=os.getenv('DB_PORT', 5432),
-        database=os.getenv('DB_NAME', 'madison_county_index'),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD')
-    )
+    """Connect to the index database (keepalives, timeouts and retries)."""
+    return connect_index_db()
 
 # ============================================================================
 # Checkpoint Management
@@ -286,7 +281,7 @@ class StagedDownloadManager:
         self.checkpoint_manager = CheckpointManager(CHECKPOINT_DIR, stage)
         self.stats = DownloadStatistics()
 
-        # Initialize downloader (will be created per document type)
+        # Initialize downloader (created by setup_downloader() when the run starts)
         self.downloader = None
 
         # Initialize GCS manager and PDF optimizer (unless dry run)
@@ -315,12 +310,12 @@ class StagedDownloadManager:
         if dry_run:
             logger.info("DRY RUN MODE - No actual downloads will be performed")
 
-    def setup_downloader(self, portal: str):
+    def setup_downloader(self):
         """
-        Setup document downloader for specific portal.
+        Setup the document downloader (one session serves every portal).
 
-        Args:
-            portal: Portal identifier ('historical', 'mid', or 'new')
+        Called once from run() before the queue is processed, so the per
+        document path never has to check for it.
         """
         # Use new requests-based downloader
         if not self.downloader:
@@ -340,18 +335,14 @@ class StagedDownloadManager:
             Tuple of (local_path, validation_data) where validation_data contains
             actual_book, actual_page, and book_page_mismatch
         """
-        portal = determine_portal(doc['book'])
+        portal = doc['portal']
         book = doc['book']
         page = doc['page']
         instrument_number = doc.get('instrument_number')
 
         try:
-            # Setup downloader if needed
-            self.setup_downloader(portal)
-
             if self.dry_run:
                 logger.info(f"[DRY RUN] Would download: Instrument {instrument_number}, Book {book}, Page {page} ({portal})")
-                time.sleep(0.1)  # Simulate delay
                 return (f"/fake/path/{book}-{page}.pdf", {
                     'actual_book': book,
                     'actual_page': page,
@@ -416,7 +407,7 @@ class StagedDownloadManager:
         if self.pdf_optimizer:
             try:
                 original_size, optimized_size = self.pdf_optimizer.optimize_in_place(local_file)
-                logger.info(f"Optimized PDF: {original_size:,} → {optimized_size:,} bytes")
+                logger.debug(f"Optimized PDF: {original_size:,} → {optimized_size:,} bytes")
             except Exception as e:
                 logger.warning(f"PDF optimization failed, uploading original: {e}")
 
@@ -455,7 +446,7 @@ class StagedDownloadManager:
                 gcs_path=gcs_path,
                 metadata=metadata
             )
-            logger.info(f"Uploaded to GCS: {gcs_url}")
+            logger.debug(f"Uploaded to GCS: {gcs_url}")
             return (gcs_url, original_size, optimized_size)
 
         except Exception as e:
@@ -470,12 +461,10 @@ class StagedDownloadManager:
             doc: Document record
         """
         doc_id = doc['id']
-        portal = determine_portal(doc['book'])
+        portal = doc['portal']
 
         try:
-            # Mark as in progress
-            self.queue.mark_in_progress(doc_id)
-
+            # Already marked in_progress when fetch_next_batch claimed it
             # Download with validation
             local_path, validation_data = self.download_document(doc)
 
@@ -558,47 +547,69 @@ class StagedDownloadManager:
                 print("Download cancelled.")
                 return
 
+        self.setup_downloader()
+
         # Process queue
         document_count = 0
         checkpoint_interval = 100
+        last_request = 0.0
+        batch = []
+        batch_done = 0
 
-        with tqdm(total=pending_count, desc="Downloading") as pbar:
-            while True:
-                # Fetch next batch
-                batch = self.queue.fetch_next_batch()
-
-                if not batch:
-                    logger.info("No more documents in queue")
-                    break
-
-                # Process each document
-                for doc in batch:
-                    self.process_document(doc)
-                    document_count += 1
-                    pbar.update(1)
-
-                    # Checkpoint periodically
-                    if document_count % checkpoint_interval == 0:
-                        checkpoint = self.queue.save_checkpoint()
-                        self.checkpoint_manager.save_checkpoint(
-                            checkpoint,
-                            self.stats.to_dict()
-                        )
-
-                    # Rate limiting (2 seconds between requests)
-                    if not self.dry_run:
-                        time.sleep(2)
-
-                # Check stage limit
-                if STAGE_CONFIGS[self.stage]['limit']:
-                    if document_count >= STAGE_CONFIGS[self.stage]['limit']:
-                        logger.info(f"Stage limit reached: {document_count}")
+        try:
+            with tqdm(total=pending_count, desc="Downloading") as pbar:
+                while True:
+                    # Fetch next batch
+                    batch = self.queue.fetch_next_batch()
+                    batch_done = 0
+
+                    if not batch:
+                        logger.info("No more documents in queue")
                         break
 
+                    # Process each document
+                    for doc in batch:
+                        # Rate limiting: only wait out whatever is left of the
+                        # interval after the previous document's own download time
+                        if not self.dry_run:
+                            remaining = REQUEST_INTERVAL - (time.monotonic() - last_request)
+                            if remaining > 0:
+                                time.sleep(remaining)
+                            last_request = time.monotonic()
+
+                        self.process_document(doc)
+                        batch_done += 1
+                        document_count += 1
+                        pbar.update(1)
+
+                        # Checkpoint periodically
+                        if document_count % checkpoint_interval == 0:
+                            checkpoint = self.queue.save_checkpoint()
+                            self.checkpoint_manager.save_checkpoint(
+                                checkpoint,
+                                self.stats.to_dict()
+                            )
+
+                    # Check stage limit
+                    if STAGE_CONFIGS[self.stage]['limit']:
+                        if document_count >= STAGE_CONFIGS[self.stage]['limit']:
+                            logger.info(f"Stage limit reached: {document_count}")
+                            break
+        finally:
+            # On Ctrl-C or an error, hand the rest of the claimed batch
+            # (including the document in progress) back to 'pending'
+            unprocessed = [doc['id'] for doc in batch[batch_done:]]
+            if unprocessed:
+                self.queue.conn.rollback()
+                self.queue.release_batch(unprocessed)
+
         # Final checkpoint
         checkpoint = self.queue.save_checkpoint()
         self.checkpoint_manager.save_checkpoint(checkpoint, self.stats.to_dict())
 
+        # Release the downloader's keep-alive connections
+        self.downloader.close()
+
         # Print final statistics
         self.stats.print_summary()
 